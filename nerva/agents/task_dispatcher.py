@@ -4,14 +4,18 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import re
+import sys
+import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from nerva.llm.client_base import BaseLLMClient
 from nerva.memory.store import MemoryStore
 from nerva.memory.schemas import MemoryItem, MemoryType
-from nerva.task_tracking.thread_store import ThreadStore
+from nerva.task_tracking.thread_store import TaskThread, ThreadStore
 from nerva.knowledge.graph import KnowledgeGraph
 
 from .vision_action_agent import VisionActionAgent
@@ -26,6 +30,13 @@ from nerva.github import GitHubManager, GitTroubleshooter
 from nerva.filesystem import FileSystemNavigator, RepoManager, RepoInfo
 # Playbook imports removed - use proper playbook infrastructure from playbooks_google.py, playbooks_research.py, etc.
 
+try:  # Optional fast JSON parser
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional
+    _json_loads = json.loads
+
 try:  # Optional voice deps
     from nerva.voice.whisper_asr import WhisperASR
     from nerva.voice.kokoro_tts import KokoroTTS
@@ -36,6 +47,48 @@ except Exception:  # pragma: no cover - optional
 
 logger = logging.getLogger(__name__)
 
+_ROUTE_RE = re.compile(r'"route"\s*:\s*"([^"]+)"')
+_DRIVE_SEARCH_RE = re.compile(r"search (.+)", re.IGNORECASE)
+_SWITCH_REPO_RE = re.compile(r"(?:switch to|go to repo|change repo)\s+(.+)")
+_BRANCH_RE = re.compile(r"(?:create|new)\s+branch\s+(?:called\s+)?['\"]?([a-zA-Z0-9_/-]+)['\"]?")
+_LOOKUP_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:phone number|number|contact info|call)\s+(?:for|to)\s+(.+)",
+        r"(?:find|get|give me|tell me)\s+(?:the\s+)?(?:phone number|number|contact info)\s+(?:for|to|of)\s+(.+)",
+        r"(?:what\'s|what is)\s+(?:the\s+)?(?:phone number|number)\s+(?:for|to|of)\s+(.+)",
+    )
+)
+_LIST_ISSUES_RE = re.compile(
+    r"list issues|show issues|open issues|what issues|github issues|issue backlog"
+)
+_LOOKUP_PREFIX_RE = re.compile(
+    r"(?:phone number for|phone for|number for|contact info for|find)\s+(.+)", re.IGNORECASE
+)
+_JSON_RE = re.compile(r"(\{.*\})", re.DOTALL)
+_URL_RE = re.compile(r"(https?://\S+)")
+
+_LOOKUP_CACHE_SIZE = 256
+
+_GH_MISSING_SUMMARY = "GitHub CLI (gh) not installed. Install with: brew install gh"
+
+
+def _plural(n: int, word: str, plural: Optional[str] = None) -> str:
+    """Format ``n`` with the singular or plural form of ``word``."""
+    return f"{n} {word if n == 1 else (plural or word + 's')}"
+
+
+def _read_line(*prompt: str) -> str:
+    """Blocking stdin read used from executor threads.
+
+    Prompt fragments are written straight to stdout rather than joined first.
+    """
+    write = sys.stdout.write
+    for part in prompt:
+        write(part)
+    sys.stdout.flush()
+    return input().strip()
+
 
 # --------------------------------------------------------------------------- #
 # Dataclasses
@@ -99,6 +152,10 @@ class TaskDispatcher:
         self.clarifier = clarifier
         self.thread_store = thread_store
         self.knowledge_graph = knowledge_graph or KnowledgeGraph()
+        self._troubleshooters: Dict[Path, GitTroubleshooter] = {}
+        self._gh_cache: Dict[tuple, tuple[float, Any]] = {}
+        self._lookup_cache: Dict[str, Optional[str]] = {}
+        self._ingested_entries: Dict[str, int] = {}
 
     async def dispatch(
         self,
@@ -112,20 +169,28 @@ class TaskDispatcher:
             thread = self.thread_store.create(project=project, title=command[:80])
             ctx.thread_id = thread.thread_id
             self.thread_store.add_entry(thread.thread_id, f"Task created: {command}")
-            if self.knowledge_graph:
-                self.knowledge_graph.ingest_thread(
-                    thread.thread_id,
-                    thread.title,
-                    [entry.__dict__ for entry in thread.entries],
-                )
-        command = await self._clarify_command(command, ctx)
+            self._ingest_thread(thread)
         route = await self._classify(command)
+        if not self._clarifies_itself(route, command):
+            clarified = await self._clarify_command(command, ctx)
+            if clarified != command:
+                command = clarified
+                route = await self._classify(command)
         handler = getattr(self, f"_handle_{route}", self._handle_unknown)
         logger.info("[TaskDispatcher] route=%s via=%s", route, ctx.source)
         result = await handler(command, ctx)
         self._record_memory(command, result, ctx)
         return result
 
+    def _clarifies_itself(self, route: str, command: str) -> bool:
+        """True for the create paths, which clarify inside their interpretation prompt."""
+        lower = command.lower()
+        if route == "calendar":
+            return self._wants_calendar_event(lower)
+        if route == "gmail":
+            return self._is_send_email_command(lower)
+        return False
+
     async def _classify(self, command: str) -> str:
         """Heuristic classifier with LLM fallback."""
         text = command.lower()
@@ -242,7 +307,7 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
         ]
         try:
             response = await self.llm.chat(messages)
-            match = re.search(r'"route"\s*:\s*"([^"]+)"', response)
+            match = _ROUTE_RE.search(response)
             if match:
                 route = match.group(1).strip().lower()
                 if route in {"calendar", "gmail", "drive", "github", "vision"}:
@@ -256,7 +321,25 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
         if not self.calendar_skill:
             raise RuntimeError("Calendar skill not configured")
 
-        lower = command.lower()
+        if self._wants_calendar_event(command.lower()):
+            event = await self._interpret_event(command)
+            try:
+                payload = await self.calendar_skill.create_event(event)
+                summary = f"Created calendar reminder '{event.title}'"
+                status = payload.get("status", "submitted")
+            except Exception as exc:
+                logger.error("Calendar event creation failed: %s", exc)
+                summary = f"Failed to create reminder: {exc}"
+                payload = {"error": str(exc)}
+                status = "error"
+        else:
+            payload = await self.calendar_skill.summarize_day()
+            count = len(payload.get("events") or [])
+            summary = f"Found {count} events"
+            status = "ok"
+        return TaskResult(command, "calendar", status, summary, payload, ctx.meta)
+
+    def _wants_calendar_event(self, lower: str) -> bool:
         create_triggers = ("create", "schedule", "add", "set", "make", "remind", "reminder")
         event_markers = (
             "event",
@@ -276,23 +359,7 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
         )
         if "remind me" in lower or "reminder" in lower:
             wants_event = True
-        if wants_event:
-            event = await self._interpret_event(command)
-            try:
-                payload = await self.calendar_skill.create_event(event)
-                summary = f"Created calendar reminder '{event.title}'"
-                status = payload.get("status", "submitted")
-            except Exception as exc:
-                logger.error("Calendar event creation failed: %s", exc)
-                summary = f"Failed to create reminder: {exc}"
-                payload = {"error": str(exc)}
-                status = "error"
-        else:
-            payload = await self.calendar_skill.summarize_day()
-            count = len(payload.get("events") or [])
-            summary = f"Found {count} events"
-            status = "ok"
-        return TaskResult(command, "calendar", status, summary, payload, ctx.meta)
+        return wants_event
 
     async def _handle_gmail(self, command: str, ctx: TaskContext) -> TaskResult:
         if not self.gmail_skill:
@@ -325,7 +392,7 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
             raise RuntimeError("Drive skill not configured")
 
         if "search" in command.lower():
-            match = re.search(r"search (.+)", command, re.IGNORECASE)
+            match = _DRIVE_SEARCH_RE.search(command)
             query = match.group(1) if match else command
             payload = await self.drive_skill.search(query.strip("'\" "))
             summary = f"Searched Drive for '{query.strip()}'"
@@ -448,20 +515,13 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
                 )
             ):
                 if not self.github_manager.gh_available:
-                    return TaskResult(
-                        command,
-                        "github",
-                        "error",
-                        "GitHub CLI (gh) not installed. Install with: brew install gh",
-                        {},
-                        ctx.meta,
-                    )
+                    return self._gh_missing_result(command, ctx)
 
                 prs = self.github_manager.list_pull_requests(limit=20)
                 if not prs:
                     summary = "No open pull requests or outstanding merges detected."
                 else:
-                    summary = f"{len(prs)} open pull request{'s' if len(prs) != 1 else ''} awaiting merge:\n"
+                    summary = f"{_plural(len(prs), 'open pull request')} awaiting merge:\n"
                     for pr in prs[:8]:
                         state = "draft" if pr.get("isDraft") else pr.get("state", "").lower()
                         summary += f"\n  #{pr['number']}: {pr['title'][:60]} ({pr.get('headRefName')} · {state})"
@@ -532,7 +592,7 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
             # Switch repository
             elif "switch to" in cmd_lower or "go to repo" in cmd_lower or "change repo" in cmd_lower:
                 # Extract repo name from command
-                match = re.search(r"(?:switch to|go to repo|change repo)\s+(.+)", cmd_lower)
+                match = _SWITCH_REPO_RE.search(cmd_lower)
                 if not match:
                     return TaskResult(
                         command,
@@ -612,25 +672,26 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
 
                 summary = f"Branch: {branch}"
                 if ahead > 0:
-                    summary += f"\n  Ahead by {ahead} commit{'s' if ahead != 1 else ''}"
+                    summary += f"\n  Ahead by {_plural(ahead, 'commit')}"
                 if behind > 0:
-                    summary += f"\n  Behind by {behind} commit{'s' if behind != 1 else ''}"
+                    summary += f"\n  Behind by {_plural(behind, 'commit')}"
                 if changes > 0:
-                    summary += f"\n  {changes} uncommitted change{'s' if changes != 1 else ''}"
+                    summary += f"\n  {_plural(changes, 'uncommitted change')}"
                 else:
                     summary += "\n  Working tree clean"
 
                 # Proactive troubleshooting warnings
-                troubleshooter = GitTroubleshooter(self.github_manager.repo_path)
+                troubleshooter = self._get_troubleshooter()
                 tips = troubleshooter.run_checks()
 
                 warnings = []
                 for tip in tips:
-                    if "conflict" in tip.title.lower():
+                    title_lower = tip.title.lower()
+                    if "conflict" in title_lower:
                         warnings.append(f"⚠️ {tip.title}")
-                    elif "behind" in tip.title.lower():
+                    elif "behind" in title_lower:
                         warnings.append(f"💡 {tip.title} - consider pulling")
-                    elif "ahead" in tip.title.lower() and ahead > 5:
+                    elif "ahead" in title_lower and ahead > 5:
                         warnings.append(f"💡 {tip.title} - consider pushing soon")
 
                 if warnings:
@@ -642,10 +703,11 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
             elif "pull" in cmd_lower:
                 result = self.github_manager.pull()
                 output = result["stdout"].strip() or result["stderr"].strip()
+                output_lower = output.lower()
 
                 # Auto-troubleshoot if pull failed
-                if "error" in output.lower() or "fatal" in output.lower() or result.get("stderr"):
-                    troubleshooter = GitTroubleshooter(self.github_manager.repo_path)
+                if "error" in output_lower or "fatal" in output_lower or result.get("stderr"):
+                    troubleshooter = self._get_troubleshooter()
                     tips = troubleshooter.run_checks()
 
                     summary = f"Git pull failed: {output[:200]}"
@@ -662,10 +724,11 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
             elif "push" in cmd_lower:
                 result = self.github_manager.push()
                 output = result["stdout"].strip() or result["stderr"].strip()
+                output_lower = output.lower()
 
                 # Auto-troubleshoot if push failed
-                if "error" in output.lower() or "fatal" in output.lower() or "rejected" in output.lower():
-                    troubleshooter = GitTroubleshooter(self.github_manager.repo_path)
+                if "error" in output_lower or "fatal" in output_lower or "rejected" in output_lower:
+                    troubleshooter = self._get_troubleshooter()
                     tips = troubleshooter.run_checks()
 
                     summary = f"Git push failed: {output[:200]}"
@@ -675,9 +738,9 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
                             summary += f"\n  • {tip.title}: {tip.fix[:100]}"
                     else:
                         # Common push failures
-                        if "rejected" in output.lower():
+                        if "rejected" in output_lower:
                             summary += "\n\n💡 Tip: Remote has changes you don't have. Try 'git pull' first."
-                        elif "no upstream" in output.lower():
+                        elif "no upstream" in output_lower:
                             summary += "\n\n💡 Tip: Set upstream with 'git push -u origin <branch>'"
                     return TaskResult(command, "github", "error", summary, result, ctx.meta)
 
@@ -686,28 +749,37 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
 
             # Troubleshooting
             elif "troubleshoot" in cmd_lower or "diagnose" in cmd_lower:
-                troubleshooter = GitTroubleshooter(self.github_manager.repo_path)
+                troubleshooter = self._get_troubleshooter()
                 tips = troubleshooter.run_checks()
 
+                # Build the summary lines and payload in a single pass over tips
+                summary_parts: List[str] = []
+                payload_tips: List[Dict[str, Any]] = []
+                auto_fixable = 0
+                for tip in tips:
+                    title = tip.title
+                    details = tip.details
+                    auto_fix = tip.auto_fix
+                    if auto_fix:
+                        auto_fixable += 1
+                    summary_parts.append(f"\n  {'🔧' if auto_fix else '💡'} {title}: {details[:100]}")
+                    payload_tips.append(
+                        {"title": title, "details": details, "fix": tip.fix, "has_auto_fix": auto_fix is not None}
+                    )
+
                 if not tips:
                     summary = "No git issues detected. Everything looks good!"
                 else:
-                    summary = f"Found {len(tips)} issue{'s' if len(tips) != 1 else ''}:\n"
-                    for tip in tips:
-                        has_fix = "🔧" if tip.auto_fix else "💡"
-                        summary += f"\n  {has_fix} {tip.title}: {tip.details[:100]}"
-
-                    # Count auto-fixable issues
-                    auto_fixable = sum(1 for t in tips if t.auto_fix)
+                    summary = f"Found {_plural(len(tips), 'issue')}:\n" + "".join(summary_parts)
                     if auto_fixable > 0:
                         summary += f"\n\n{auto_fixable} issue(s) can be auto-fixed. Say 'fix all issues' to apply fixes."
 
-                payload = {"tips": [{"title": t.title, "details": t.details, "fix": t.fix, "has_auto_fix": t.auto_fix is not None} for t in tips]}
+                payload = {"tips": payload_tips}
                 return TaskResult(command, "github", "ok", summary, payload, ctx.meta)
 
             # Auto-fix issues
             elif "fix" in cmd_lower and any(phrase in cmd_lower for phrase in ["issues", "problems", "all", "it"]):
-                troubleshooter = GitTroubleshooter(self.github_manager.repo_path)
+                troubleshooter = self._get_troubleshooter()
                 tips = troubleshooter.run_checks()
 
                 auto_fixable = [t for t in tips if t.auto_fix]
@@ -724,11 +796,13 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
                     confirm_msg += "\n\nDo you want me to fix these? (yes/no)"
 
                     response = await self.clarifier(confirm_msg)
-                    if not response or "no" in response.lower() or "cancel" in response.lower():
+                    response_lower = response.lower() if response else ""
+                    if not response or "no" in response_lower or "cancel" in response_lower:
                         summary = "Auto-fix cancelled by user"
                         return TaskResult(command, "github", "ok", summary, {}, ctx.meta)
 
                 # Execute auto-fixes
+                self._gh_cache.clear()
                 results = []
                 for tip in auto_fixable:
                     try:
@@ -757,33 +831,20 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
                 return TaskResult(command, "github", "ok" if success_count > 0 else "error", summary, {"results": results}, ctx.meta)
 
             # List issues via GitHub CLI
-            elif any(
-                kw in cmd_lower
-                for kw in (
-                    "list issues",
-                    "show issues",
-                    "open issues",
-                    "what issues",
-                    "github issues",
-                    "issue backlog",
-                )
-            ):
+            elif _LIST_ISSUES_RE.search(cmd_lower) is not None:
                 if not self.github_manager.gh_available:
-                    return TaskResult(
-                        command,
-                        "github",
-                        "error",
-                        "GitHub CLI (gh) not installed. Install with: brew install gh",
-                        {},
-                        ctx.meta,
-                    )
+                    return self._gh_missing_result(command, ctx)
 
-                issues = self.github_manager.list_issues(limit=10)
+                issues = self._cached_gh(
+                    ("issues", str(self.github_manager.repo_path), 10),
+                    30,
+                    lambda: self.github_manager.list_issues(limit=10),
+                )
 
                 if not issues:
                     summary = "No open issues found"
                 else:
-                    summary = f"Found {len(issues)} open issue{'s' if len(issues) != 1 else ''}:\n"
+                    summary = f"Found {_plural(len(issues), 'open issue')}:\n"
                     for issue in issues[:5]:
                         summary += f"\n  #{issue['number']}: {issue['title'][:60]} ({issue['state']})"
 
@@ -792,21 +853,18 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
             # List notifications
             elif "notification" in cmd_lower:
                 if not self.github_manager.gh_available:
-                    return TaskResult(
-                        command,
-                        "github",
-                        "error",
-                        "GitHub CLI (gh) not installed. Install with: brew install gh",
-                        {},
-                        ctx.meta,
-                    )
+                    return self._gh_missing_result(command, ctx)
 
-                notifications = self.github_manager.list_notifications(limit=20)
+                notifications = self._cached_gh(
+                    ("notifications", 20),
+                    60,
+                    lambda: self.github_manager.list_notifications(limit=20),
+                )
 
                 if not notifications:
                     summary = "No GitHub notifications"
                 else:
-                    summary = f"You have {len(notifications)} notification{'s' if len(notifications) != 1 else ''}:\n"
+                    summary = f"You have {_plural(len(notifications), 'notification')}:\n"
                     for notif in notifications[:5]:
                         summary += f"\n  • {notif.get('subject', 'Unknown')[:60]}"
 
@@ -814,7 +872,7 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
 
             # Create branch
             elif "create branch" in cmd_lower or "new branch" in cmd_lower:
-                match = re.search(r"(?:create|new)\s+branch\s+(?:called\s+)?['\"]?([a-zA-Z0-9_/-]+)['\"]?", cmd_lower)
+                match = _BRANCH_RE.search(cmd_lower)
                 if not match:
                     return TaskResult(
                         command,
@@ -826,6 +884,7 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
                     )
 
                 branch_name = match.group(1)
+                self._gh_cache.clear()
                 self.github_manager.create_branch(branch_name)
                 summary = f"Created and checked out branch: {branch_name}"
                 return TaskResult(command, "github", "ok", summary, {"branch": branch_name}, ctx.meta)
@@ -837,28 +896,48 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
                 return TaskResult(command, "github", "ok", summary, status_info, ctx.meta)
 
         except Exception as e:
-            logger.error(f"[TaskDispatcher] GitHub handler error: {e}")
+            err = str(e)
+            logger.error("[TaskDispatcher] GitHub handler error: %s", err)
             return TaskResult(
                 command,
                 "github",
                 "error",
-                f"GitHub operation failed: {str(e)}",
-                {"error": str(e)},
+                f"GitHub operation failed: {err}",
+                {"error": err},
                 ctx.meta,
             )
 
+    @staticmethod
+    def _gh_missing_result(command: str, ctx: TaskContext) -> TaskResult:
+        return TaskResult(command, "github", "error", _GH_MISSING_SUMMARY, {}, ctx.meta)
+
+    def _get_troubleshooter(self) -> GitTroubleshooter:
+        """Return a GitTroubleshooter for the active repo, reusing prior instances."""
+        repo_path = Path(self.github_manager.repo_path)
+        troubleshooter = self._troubleshooters.get(repo_path)
+        if troubleshooter is None:
+            troubleshooter = GitTroubleshooter(repo_path)
+            self._troubleshooters[repo_path] = troubleshooter
+        return troubleshooter
+
+    def _cached_gh(self, key: tuple, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Memoize a gh CLI read for ``ttl`` seconds; write operations clear the cache."""
+        now = time.monotonic()
+        entry = self._gh_cache.get(key)
+        if entry and now - entry[0] < ttl:
+            return entry[1]
+        value = fn()
+        self._gh_cache[key] = (now, value)
+        return value
+
     async def _handle_lookup(self, command: str, ctx: TaskContext) -> TaskResult:
         """Handle business lookup / phone-number queries via deterministic playbook."""
         query = await self._interpret_lookup(command)
         if not query:
             # Fallback: strip common prefixes with regex
             cmd_lower = command.lower()
-            for pattern in [
-                r"(?:phone number|number|contact info|call)\s+(?:for|to)\s+(.+)",
-                r"(?:find|get|give me|tell me)\s+(?:the\s+)?(?:phone number|number|contact info)\s+(?:for|to|of)\s+(.+)",
-                r"(?:what\'s|what is)\s+(?:the\s+)?(?:phone number|number)\s+(?:for|to|of)\s+(.+)",
-            ]:
-                match = re.search(pattern, cmd_lower, re.IGNORECASE)
+            for pattern in _LOOKUP_PATTERNS:
+                match = pattern.search(cmd_lower)
                 if match:
                     query = match.group(1).strip()
                     break
@@ -881,11 +960,8 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
         if is_lookup:
             # Extract the business/location from the query
             # e.g., "phone number for Target in Tinley Park" -> "Target Tinley Park"
-            query = command
-            for prefix in ["phone number for", "phone for", "number for", "contact info for", "find"]:
-                if prefix in cmd_lower:
-                    query = command[command.lower().find(prefix) + len(prefix):].strip()
-                    break
+            match = _LOOKUP_PREFIX_RE.search(command)
+            query = match.group(1).strip() if match else command
 
             # Use deterministic lookup playbook
             result = await self.vision_agent.lookup_phone_number(query)
@@ -911,14 +987,11 @@ Reply with JSON: {"route":"calendar|gmail|drive|github|vision","reason":"..."}."
     # ------------------------------------------------------------------ #
 
     async def _interpret_event(self, command: str) -> CalendarEvent:
-        prompt = """Extract a Google Calendar event from the request.
-Return JSON with keys: title, date, start_time, end_time, location, description."""
-        messages = [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": command},
-        ]
-        response = await self.llm.chat(messages)
-        data = self._extract_structured(response)
+        data = await self._interpret_and_clarify(
+            command,
+            "Extract a Google Calendar event from the request.\n"
+            "The payload has keys: title, date, start_time, end_time, location, description.",
+        )
         return CalendarEvent(
             title=data.get("title") or "Untitled Event",
             date=data.get("date"),
@@ -929,14 +1002,11 @@ Return JSON with keys: title, date, start_time, end_time, location, description.
         )
 
     async def _interpret_email(self, command: str) -> EmailDraft:
-        prompt = """Extract email fields from this request.
-Return JSON: {"to":["recipient@example.com"],"subject":"...","body":"..."}"""
-        messages = [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": command},
-        ]
-        response = await self.llm.chat(messages)
-        data = self._extract_structured(response)
+        data = await self._interpret_and_clarify(
+            command,
+            "Extract email fields from this request.\n"
+            'The payload looks like {"to":["recipient@example.com"],"subject":"...","body":"..."}.',
+        )
         recipients = data.get("to") or data.get("recipients") or []
         if isinstance(recipients, str):
             recipients = [recipients]
@@ -956,6 +1026,8 @@ Return JSON: {"to":["recipient@example.com"],"subject":"...","body":"..."}"""
         )
 
     async def _interpret_lookup(self, command: str) -> Optional[str]:
+        if command in self._lookup_cache:
+            return self._lookup_cache[command]
         prompt = """Extract the business or place the user wants information about.
 Return JSON: {"query": "..."}"""
         messages = [
@@ -964,27 +1036,67 @@ Return JSON: {"query": "..."}"""
         ]
         try:
             response = await self.llm.chat(messages)
-            data = self._extract_structured(response)
-            query = data.get("query")
-            if isinstance(query, str) and query.strip():
-                return query.strip()
         except Exception:
-            pass
-        return None
+            return None
+        data = self._extract_structured(response)
+        query = data.get("query")
+        result = query.strip() if isinstance(query, str) and query.strip() else None
+        if len(self._lookup_cache) >= _LOOKUP_CACHE_SIZE:
+            self._lookup_cache.pop(next(iter(self._lookup_cache)))
+        self._lookup_cache[command] = result
+        return result
+
+    async def _interpret_and_clarify(
+        self,
+        command: str,
+        schema: str,
+        *,
+        allow_clarification: bool = True,
+    ) -> Dict[str, Any]:
+        """Clarify and interpret in one LLM round-trip, returning the payload dict."""
+        prompt = f"""{schema}
+Also determine if the user's request is ambiguous. Only request clarification if it is absolutely necessary.
+Respond with JSON like {{"needs_clarification": true/false, "question": "Follow-up question", "payload": {{...}}}}."""
+        messages = [
+            {"role": "system", "content": prompt},
+            {"role": "user", "content": command},
+        ]
+        response = await self.llm.chat(messages)
+        data = self._extract_structured(response)
+
+        if allow_clarification and data.get("needs_clarification"):
+            question = data.get("question") or "Can you clarify?"
+            answer = await self._ask_clarification(question)
+            if answer:
+                return await self._interpret_and_clarify(
+                    f"{command}\nClarification: {answer.strip()}",
+                    schema,
+                    allow_clarification=False,
+                )
+
+        payload = data.get("payload")
+        return payload if isinstance(payload, dict) else data
 
     @staticmethod
     def _extract_structured(text: str) -> Dict[str, Any]:
-        match = re.search(r"(\{.*\})", text, re.DOTALL)
+        text = text.strip()
+        if text.startswith("{") and text.endswith("}"):
+            # Already bare JSON; the regex would capture the same span
+            try:
+                return _json_loads(text)
+            except Exception:
+                return {}
+        match = _JSON_RE.search(text)
         if not match:
             return {}
         try:
-            return json.loads(match.group(1))
+            return _json_loads(match.group(1))
         except Exception:
             return {}
 
     @staticmethod
     def _extract_url(command: str) -> Optional[str]:
-        match = re.search(r"(https?://\S+)", command)
+        match = _URL_RE.search(command)
         return match.group(1) if match else None
 
     def _record_memory(self, command: str, result: TaskResult, ctx: TaskContext) -> None:
@@ -1006,12 +1118,21 @@ Return JSON: {"query": "..."}"""
                     entry_text,
                     metadata={"route": result.route, "status": result.status},
                 )
-                if self.knowledge_graph:
-                    self.knowledge_graph.ingest_thread(
-                        thread.thread_id,
-                        thread.title,
-                        [entry.__dict__ for entry in thread.entries],
-                    )
+                self._ingest_thread(thread)
+
+    def _ingest_thread(self, thread: TaskThread) -> None:
+        """Feed only entries not yet seen by the knowledge graph."""
+        if not self.knowledge_graph:
+            return
+        prev = self._ingested_entries.get(thread.thread_id, 0)
+        if len(thread.entries) <= prev:
+            return
+        self.knowledge_graph.ingest_thread(
+            thread.thread_id,
+            thread.title,
+            (entry.__dict__ for entry in thread.entries[prev:]),
+        )
+        self._ingested_entries[thread.thread_id] = len(thread.entries)
 
     async def _clarify_command(self, command: str, ctx: TaskContext) -> str:
         prompt = """You are a task clarifier. Determine if the user's request is ambiguous.
@@ -1040,11 +1161,7 @@ Only request clarification if it is absolutely necessary."""
         if self.clarifier:
             return await self.clarifier(question)
         loop = asyncio.get_running_loop()
-
-        def _prompt() -> str:
-            return input(f"[Clarify] {question} ").strip()
-
-        return await loop.run_in_executor(None, _prompt)
+        return await loop.run_in_executor(None, _read_line, "[Clarify] ", question, " ")
 
 
 # --------------------------------------------------------------------------- #
@@ -1056,20 +1173,20 @@ class SafetyManager:
     """Simple risk detector + confirmation workflow."""
 
     risky_keywords = {"delete", "send", "purchase", "submit", "transfer", "publish", "remove"}
+    # Stems (trailing "e" dropped) matched anywhere, like a substring check, so inflected and
+    # prefixed forms ("deleting", "submitted", "resend", "undelete") still need confirmation
+    _risky_re = re.compile("|".join(sorted(re.escape(k.removesuffix("e")) for k in risky_keywords)))
 
     def requires_confirmation(self, command: str) -> bool:
-        lower = command.lower()
-        return any(word in lower for word in self.risky_keywords)
+        return self._risky_re.search(command.lower()) is not None
 
     async def confirm(self, command: str) -> bool:
         """Prompt user for confirmation via stdin (works for CLI/voice)."""
         loop = asyncio.get_running_loop()
-
-        def _ask() -> str:
-            return input(f"[Safety] Confirm action '{command}'? (y/N): ").strip().lower()
-
-        reply = await loop.run_in_executor(None, _ask)
-        return reply in {"y", "yes"}
+        reply = await loop.run_in_executor(
+            None, _read_line, "[Safety] Confirm action '", command, "'? (y/N): "
+        )
+        return reply.lower() in {"y", "yes"}
 
 
 # --------------------------------------------------------------------------- #
@@ -1080,10 +1197,15 @@ class SafetyManager:
 class HotkeyManager:
     """Basic stdin-based hotkey watcher."""
 
+    prompt = "[Hotkey] Enter command (*, :calendar, :quit): "
+
     def __init__(self) -> None:
         self._handlers: Dict[str, Callable[[], Awaitable[None]]] = {}
         self._task: Optional[asyncio.Task] = None
         self._running = False
+        self._lines: Optional[asyncio.Queue[Optional[str]]] = None
+        self._partial = b""  # bytes read from stdin after the last newline
+        self._eof = False
 
     def register(self, key: str, handler: Callable[[], Awaitable[None]]) -> None:
         self._handlers[key.lower()] = handler
@@ -1096,27 +1218,74 @@ class HotkeyManager:
 
     async def stop(self) -> None:
         self._running = False
+        if self._lines is not None:
+            self._lines.put_nowait(None)
         if self._task:
             await self._task
             self._task = None
 
     async def _listen_loop(self) -> None:
         loop = asyncio.get_running_loop()
-        while self._running:
-            cmd = await loop.run_in_executor(
-                None, lambda: input("[Hotkey] Enter command (*, :calendar, :quit): ").strip()
-            )
-            if not cmd:
-                continue
-            key = cmd.lower()
-            if key in (":quit", ":exit"):
-                self._running = False
-                break
-            handler = self._handlers.get(key)
-            if handler:
-                await handler()
-            else:
-                print(f"[Hotkey] No handler for {cmd}")
+        # Windows event loops have no add_reader support for stdin
+        use_reader = sys.platform != "win32"
+        fd = sys.stdin.fileno() if use_reader else -1
+        if use_reader:
+            self._lines = asyncio.Queue()
+            self._partial = b""
+            self._eof = False
+            loop.add_reader(fd, self._on_stdin, fd)
+        try:
+            while self._running:
+                if use_reader:
+                    sys.stdout.write(self.prompt)
+                    sys.stdout.flush()
+                    cmd = await self._lines.get()
+                    if cmd is None:
+                        break
+                else:
+                    cmd = await loop.run_in_executor(None, _read_line, self.prompt)
+                if not cmd:
+                    continue
+                key = cmd.lower()
+                if key in (":quit", ":exit"):
+                    self._running = False
+                    break
+                handler = self._handlers.get(key)
+                if not handler:
+                    print(f"[Hotkey] No handler for {cmd}")
+                    continue
+                if not use_reader:
+                    await handler()
+                    continue
+                # Handlers may prompt on stdin (clarification, safety confirm); release the fd
+                # so their input() sees the reply instead of the hotkey queue
+                loop.remove_reader(fd)
+                try:
+                    await handler()
+                finally:
+                    if not self._eof:
+                        loop.add_reader(fd, self._on_stdin, fd)
+        finally:
+            if use_reader:
+                loop.remove_reader(fd)
+                self._lines = None
+
+    def _on_stdin(self, fd: int) -> None:
+        """Event-loop reader callback: queue each complete stdin line (None on EOF)."""
+        # Unbuffered read: with readline() extra lines would sit in Python's buffer while the
+        # fd stays unreadable, so they would never be delivered
+        data = os.read(fd, 4096)
+        if not data:
+            self._eof = True
+            asyncio.get_running_loop().remove_reader(fd)
+            if self._partial:
+                self._lines.put_nowait(self._partial.decode(errors="replace").strip())
+                self._partial = b""
+            self._lines.put_nowait(None)
+            return
+        *lines, self._partial = (self._partial + data).split(b"\n")
+        for line in lines:
+            self._lines.put_nowait(line.decode(errors="replace").strip())
 
 
 class AmbientMonitor:
@@ -1179,6 +1348,8 @@ class VoiceControlAgent:
 
         self.dispatcher = dispatcher
         self.wake_word = wake_word.lower()
+        # Captures everything after the wake word in the same pass as the match
+        self._wake_re = re.compile(rf"\b{re.escape(self.wake_word)}\b[\s,.:!?]*(.*)", re.DOTALL)
         self.asr = WhisperASR(model_path=whisper_model)
         self.tts = KokoroTTS() if enable_tts else None
         self.safety = safety_manager or dispatcher.safety
@@ -1205,8 +1376,11 @@ class VoiceControlAgent:
             lower = text.lower()
             if self.wake_word not in lower:
                 continue
+            match = self._wake_re.search(lower)
+            if match is None:
+                continue
 
-            command = lower.split(self.wake_word, 1)[-1].strip() or text
+            command = match.group(1).strip() or text
             print(f"\n[Voice] Command detected: {command}")
 
             if self.safety.requires_confirmation(command):
@@ -1229,14 +1403,17 @@ class VoiceControlAgent:
         if self.tts:
             self.tts.speak(text, blocking=False)
         else:
-            print(f"[Voice] {text}")
+            write = sys.stdout.write
+            write("[Voice] ")
+            write(text)
+            write("\n")
 
 
 def create_default_hotkeys(dispatcher: TaskDispatcher) -> HotkeyManager:
     """
     Convenience helper that registers the '*' (numpad asterisk) macro hotkey.
 
-    Pressing '*' kicks off three core summaries in sequence:
+    Pressing '*' kicks off three core summaries concurrently:
         1. Summarize today's calendar
         2. Summarize unread Gmail
         3. List recent Drive files
@@ -1249,15 +1426,19 @@ def create_default_hotkeys(dispatcher: TaskDispatcher) -> HotkeyManager:
             "Show unread Gmail messages",
             "List my most recent Google Drive files",
         ]
-        for command in commands:
-            try:
-                result = await dispatcher.dispatch(
-                    command,
-                    TaskContext(source="hotkey", meta={"macro": "*"}),
-                )
+        # The summaries are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(
+                dispatcher.dispatch(command, TaskContext(source="hotkey", meta={"macro": "*"}))
+                for command in commands
+            ),
+            return_exceptions=True,
+        )
+        for command, result in zip(commands, results):
+            if isinstance(result, BaseException):  # pragma: no cover - live usage
+                print(f"[Hotkey:*] Error handling '{command}': {result}")
+            else:
                 print(f"[Hotkey:*] {result.route}: {result.summary}")
-            except Exception as exc:  # pragma: no cover - live usage
-                print(f"[Hotkey:*] Error handling '{command}': {exc}")
 
     manager = HotkeyManager()
     manager.register("*", _star_macro)
@@ -1,11 +1,22 @@
 """VisionActionAgent: Vision → Reasoning → Action loop for browser automation."""
 from __future__ import annotations
 import asyncio
+import io
 import logging
+import os
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import Image
+
+try:  # Optional Hyperscan DFA scanner for phone numbers
+    import hyperscan
+except ImportError:  # pragma: no cover - optional
+    hyperscan = None
 
 from nerva.vision.qwen_vision import QwenVision
 from nerva.tools.browser_automation import BrowserAutomation
@@ -17,6 +28,167 @@ logger = logging.getLogger(__name__)
 PHONE_REGEX = re.compile(r"(?:\+?1[-.\s]*)?(?:\(\d{3}\)|\d{3})[-.\s]*\d{3}[-.\s]*\d{4}")
 
 
+def _compile_phone_db():
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[PHONE_REGEX.pattern.encode()],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+        return db
+    except Exception as exc:  # pragma: no cover - unsupported pattern/platform
+        logger.debug("Hyperscan phone database unavailable: %s", exc)
+        return None
+
+
+_PHONE_HS_DB = _compile_phone_db()
+
+
+def _phone_spans(content: str) -> List[Tuple[int, int]]:
+    """
+    Return (start, end) spans of phone-like substrings, like PHONE_REGEX.finditer.
+
+    Uses Hyperscan's single-pass DFA when available and the text is ASCII (so byte
+    offsets equal string offsets); otherwise falls back to the regex.
+    """
+    if _PHONE_HS_DB is not None and content.isascii():
+        hits: List[Tuple[int, int]] = []
+
+        def _on_match(_id: int, start: int, end: int, _flags: int, _ctx: object) -> None:
+            hits.append((start, end))
+
+        _PHONE_HS_DB.scan(content.encode("ascii"), match_event_handler=_on_match)
+        # Hyperscan reports every end offset; keep leftmost-longest, non-overlapping spans
+        hits.sort(key=lambda span: (span[0], -span[1]))
+        spans: List[Tuple[int, int]] = []
+        last_end = -1
+        for start, end in hits:
+            if start >= last_end:
+                spans.append((start, end))
+                last_end = end
+        return spans
+    return [match.span() for match in PHONE_REGEX.finditer(content)]
+
+
+# bytes.translate deletion table: everything except ASCII 0-9
+_NON_DIGITS = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+_PHONE_CONTEXT = 80
+# Responses worth scanning for phone numbers before falling back to the rendered body text
+_PHONE_RESPONSE_URL_RE = re.compile(r"/search|/maps/api/place")
+
+# Actions that leave the page untouched; the next frame can be captured without a settle delay
+_NON_MUTATING_ACTIONS = frozenset({"wait"})
+# Actions after which cached vision responses still describe the page; any other executed
+# action (click, type, navigate) may have changed it in ways the dHash barely registers
+_VISION_CACHE_SAFE_ACTIONS = frozenset({"wait", "scroll"})
+
+# Resource types aborted when resource blocking is enabled. Deterministic playbooks only
+# need the DOM; vision-driven runs keep images and CSS so screenshots stay faithful.
+PLAYBOOK_BLOCKED_RESOURCES = frozenset(
+    {"image", "stylesheet", "font", "media", "beacon", "csp_report", "imageset", "texttrack"}
+)
+VISION_BLOCKED_RESOURCES = frozenset({"font", "media", "beacon", "csp_report", "texttrack"})
+
+# URL, document height, scroll offset and viewport height, used to decide frame reuse
+_PAGE_STATE_SCRIPT = (
+    "() => [location.href, document.documentElement.scrollHeight, window.scrollY, window.innerHeight]"
+)
+
+# Structured "FIELD: value" / "FIELD: [value]" lines emitted by the vision prompt
+_ACTION_FIELDS = ("ACTION", "TARGET", "VALUE", "REASON", "CONFIDENCE")
+# Leading list/heading/bold markers the model sometimes puts before a key: "1. ", "- ", "**"
+_KEY_PREFIX_RE = re.compile(r"^[\s\-*+#>]*(?:\d+[.)]\s*)?[\s*]*")
+
+# Near-duplicate screenshots (by dHash Hamming distance) reuse the previous vision response
+# tmpfs keeps per-step screenshots off the disk where available
+SCREENSHOT_DIR = Path("/dev/shm/nerva_screenshots" if os.path.isdir("/dev/shm") else "/tmp/nerva_screenshots")
+
+VISION_CACHE_SIZE = 16
+VISION_CACHE_MAX_DISTANCE = 4
+# Appended to the task when the model repeats an action that left the page unchanged
+_RECONSIDER_NOTE = (
+    "\n\nNOTE: The previous action ({action_type} {target}) had no visible effect. "
+    "Reconsider and choose a different action."
+)
+
+
+def _dhash(image: Union[Path, bytes]) -> int:
+    """Compute a 64-bit difference hash of an image (path or encoded bytes) for near-duplicate detection."""
+    with Image.open(io.BytesIO(image) if isinstance(image, bytes) else image) as img:
+        small = img.convert("L").resize((9, 8), Image.BILINEAR)
+    pixels = small.tobytes()
+    value = 0
+    for row in range(0, 72, 9):
+        for col in range(row, row + 8):
+            value = (value << 1) | (pixels[col] > pixels[col + 1])
+    return value
+
+
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "in", "on", "at", "to", "for", "of", "with",
+    "button", "link", "input", "field", "box", "element",
+})
+
+
+@lru_cache(maxsize=256)
+def _extract_keywords(description: str) -> Tuple[str, ...]:
+    """Extract up to three meaningful keywords from an element description."""
+    words = description.lower().split()
+    keywords = [w.strip(".,!?\"'") for w in words if w not in _STOP_WORDS]
+    return tuple(keywords[:3])
+
+
+@lru_cache(maxsize=256)
+def _build_selectors(description: str) -> Tuple[str, ...]:
+    """Ordered Playwright selector candidates for a natural language element description."""
+    desc_lower = description.lower()
+    selectors: List[str] = []
+
+    # Check for specific element types
+    if "button" in desc_lower:
+        # Look for buttons containing keywords
+        for kw in _extract_keywords(description):
+            selectors.extend([
+                f"button:has-text('{kw}')",
+                f"input[type='button']:has-text('{kw}')",
+                f"input[type='submit']:has-text('{kw}')",
+                f"a:has-text('{kw}')",
+            ])
+
+    elif "link" in desc_lower:
+        for kw in _extract_keywords(description):
+            selectors.append(f"a:has-text('{kw}')")
+
+    elif "input" in desc_lower or "field" in desc_lower or "search" in desc_lower:
+        # Look for input fields
+        if "search" in desc_lower:
+            selectors.extend([
+                "input[type='search']",
+                "input[placeholder*='search' i]",
+                "input[name*='search' i]",
+            ])
+        else:
+            for kw in _extract_keywords(description):
+                selectors.extend([
+                    f"input[placeholder*='{kw}' i]",
+                    f"input[name*='{kw}' i]",
+                ])
+
+    else:
+        # Generic text search
+        for kw in _extract_keywords(description):
+            selectors.extend([
+                f"text={kw}",
+                f"*:has-text('{kw}')",
+            ])
+
+    return tuple(selectors)
+
+
 @dataclass
 class BrowserAction:
     """Represents a browser action parsed from vision analysis."""
@@ -52,6 +224,9 @@ class VisionActionAgent:
         max_steps: int = 20,
         verify_actions: bool = False,
         answer_task: bool = True,
+        enable_resource_blocking: bool = False,
+        screenshot_format: Literal["png", "jpeg"] = "jpeg",
+        screenshot_quality: int = 80,
     ):
         """
         Initialize VisionActionAgent.
@@ -61,14 +236,35 @@ class VisionActionAgent:
             browser: BrowserAutomation instance (created if not provided)
             max_steps: Maximum steps before aborting
             verify_actions: Whether to verify each action result
+            enable_resource_blocking: Abort fonts/media/beacons (and images/CSS for playbooks)
+            screenshot_format: Step screenshot format; use "png" if the vision model needs lossless input
+            screenshot_quality: JPEG quality for step screenshots
         """
         self.vision = vision or QwenVision()  # Uses config defaults (SOLLOL routing)
         self.browser = browser or BrowserAutomation(headless=False)
         self.max_steps = max_steps
         self.verify_actions = verify_actions
         self.answer_task = answer_task
-        self._screenshot_dir = Path("/tmp/nerva_screenshots")
+        self.enable_resource_blocking = enable_resource_blocking
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self._screenshot_suffix = ".jpg" if screenshot_format == "jpeg" else ".png"
+        self._screenshot_dir = SCREENSHOT_DIR
         self._screenshot_dir.mkdir(exist_ok=True)
+        self._vision_cache: "OrderedDict[Tuple[int, str], str]" = OrderedDict()
+        self._last_frame: Optional[Tuple[Path, List[Any]]] = None
+        self._frame_hash: Optional[int] = None  # dHash of the frame last sent to _vision_action
+        self._selector_cache: Dict[str, str] = {}
+        # (description, selectors, probe task) started while the vision response streams in
+        self._preflight: Optional[Tuple[str, Tuple[str, ...], asyncio.Task]] = None
+        # action_type -> bound handler, resolved once instead of an if/elif chain per step
+        self._action_handlers = {
+            "click": self._do_click,
+            "type": self._do_type,
+            "scroll": self._do_scroll,
+            "navigate": self._do_navigate,
+            "wait": self._do_wait,
+        }
         logger.info("[VisionActionAgent] Initialized")
         self._playbook_runner = PlaybookRunner(browser=self.browser)
         self._planner = UIPlanner(browser=self.browser, executor=self._perform_action)
@@ -93,6 +289,10 @@ class VisionActionAgent:
 
         # Start browser
         await self.browser.start()
+        self._last_frame = None
+        self._vision_cache.clear()
+        if self.enable_resource_blocking:
+            await self.browser.block_resources(VISION_BLOCKED_RESOURCES)
 
         try:
             # Navigate to starting URL if provided
@@ -109,20 +309,27 @@ class VisionActionAgent:
             # Execute task loop
             history = []
             step = 0
+            last_key: Optional[Tuple[str, str, Optional[str]]] = None
+            last_hash: Optional[int] = None
+            reconsider: Optional[BrowserAction] = None
 
             while step < self.max_steps:
                 step += 1
                 logger.info(f"[VisionActionAgent] Step {step}/{self.max_steps}")
+                # A preflight the previous step did not consume describes a stale page
+                self._discard_preflight()
 
                 # 1. Capture screenshot
-                screenshot_path = self._screenshot_dir / f"step_{step:02d}.png"
-                await self._take_screenshot(screenshot_path)
+                screenshot_path = self._screenshot_dir / f"step_{step:02d}{self._screenshot_suffix}"
+                screenshot = await self._take_screenshot(screenshot_path)
 
-                # 2. Analyze with vision model
-                vision_response = await self.vision.extract_browser_action(
-                    screenshot_path,
-                    task=task,
-                )
+                # 2. Analyze with vision model (skipped when the frame is a near-duplicate)
+                prompt_task = task
+                if reconsider is not None:
+                    prompt_task += _RECONSIDER_NOTE.format(
+                        action_type=reconsider.action_type, target=reconsider.target
+                    )
+                vision_response = await self._vision_action(screenshot_path, prompt_task, screenshot)
 
                 logger.debug(f"[VisionActionAgent] Vision response:\n{vision_response}")
 
@@ -159,6 +366,34 @@ class VisionActionAgent:
                         "answer": info,
                     }
 
+                # 4b. Same action on an unchanged page: skip it and re-prompt once, then give up
+                action_key = (action.action_type, action.target, action.value)
+                frame_hash = self._frame_hash
+                stalled = (
+                    action_key == last_key
+                    and action.action_type not in _NON_MUTATING_ACTIONS
+                    and frame_hash is not None
+                    and last_hash is not None
+                    and (frame_hash ^ last_hash).bit_count() <= VISION_CACHE_MAX_DISTANCE
+                )
+                last_key, last_hash = action_key, frame_hash
+                if stalled:
+                    if reconsider is not None:
+                        logger.warning("[VisionActionAgent] Stuck repeating %s %s", action.action_type, action.target)
+                        return {
+                            "status": "stuck",
+                            "reason": f"Repeated {action.action_type} on '{action.target}' had no visible effect",
+                            "steps": step,
+                            "history": history,
+                            "answer": None,
+                        }
+                    logger.info("[VisionActionAgent] Repeated action with no visible change; re-prompting")
+                    history[-1]["skipped"] = "repeated action with no visible change"
+                    reconsider = action
+                    await asyncio.sleep(3)
+                    continue
+                reconsider = None
+
                 # 5. Execute action
                 try:
                     planner_info = await self._planner.run(action)
@@ -177,8 +412,9 @@ class VisionActionAgent:
                     if step >= self.max_steps - 1:
                         break
 
-                # 6. Wait for page to update
-                await asyncio.sleep(1)
+                # 6. Wait for page to update (a wait action already paused, so capture right away)
+                if action.action_type not in _NON_MUTATING_ACTIONS:
+                    await asyncio.sleep(1)
 
             # Max steps reached
             logger.warning(f"[VisionActionAgent] Max steps ({self.max_steps}) reached")
@@ -195,6 +431,7 @@ class VisionActionAgent:
 
         finally:
             # Clean up browser
+            self._discard_preflight()
             await self.browser.stop()
 
     async def run_playbook(self, playbook: Playbook) -> List[Dict[str, Any]]:
@@ -202,6 +439,11 @@ class VisionActionAgent:
         Execute a predefined UI playbook using the shared browser.
         Useful for stateful multi-step flows (logins, approvals, etc.).
         """
+        self._last_frame = None
+        if self.enable_resource_blocking:
+            if not self.browser.page:
+                await self.browser.start()
+            await self.browser.block_resources(PLAYBOOK_BLOCKED_RESOURCES)
         return await self._playbook_runner.run(playbook)
 
     async def research_topic(self, query: str, result_count: int = 3) -> Dict[str, Any]:
@@ -225,8 +467,25 @@ class VisionActionAgent:
         then extract phone numbers directly from the page with a regex.
         """
         playbook = build_lookup_playbook(query)
-        results = await self.run_playbook(playbook)
-        phone = await self._extract_phone_number(query)
+        if not self.browser.page:
+            await self.browser.start()
+        page = self.browser.page
+        body_reads: List[asyncio.Future] = []
+
+        def _capture_response(response) -> None:
+            content_type = response.headers.get("content-type", "")
+            if content_type.startswith("application/json") and _PHONE_RESPONSE_URL_RE.search(response.url):
+                # Read eagerly: bodies can be evicted once the page navigates on
+                body_reads.append(asyncio.ensure_future(response.text()))
+
+        page.on("response", _capture_response)
+        try:
+            results = await self.run_playbook(playbook)
+        finally:
+            page.remove_listener("response", _capture_response)
+
+        bodies = [body for body in await asyncio.gather(*body_reads, return_exceptions=True) if isinstance(body, str)]
+        phone = await self._extract_phone_number(query, captured="\n".join(bodies))
         answer = None
         if phone:
             answer = f"The phone number for {query} is {phone}."
@@ -240,13 +499,113 @@ class VisionActionAgent:
             "phone": phone,
         }
 
-    async def _take_screenshot(self, path: Path) -> None:
-        """Take screenshot of current browser state."""
+    async def _take_screenshot(self, path: Path) -> bytes:
+        """Take screenshot of current browser state, returning the encoded image as well."""
         if not self.browser.page:
             raise RuntimeError("Browser page not initialized")
 
-        await self.browser.page.screenshot(path=str(path))
+        if self.screenshot_format == "jpeg":
+            data = await self.browser.page.screenshot(path=str(path), type="jpeg", quality=self.screenshot_quality)
+        else:
+            data = await self.browser.page.screenshot(path=str(path), type="png")
+        self._last_frame = (path, await self._page_state())
         logger.debug(f"[VisionActionAgent] Screenshot saved: {path}")
+        return data
+
+    async def _page_state(self) -> Optional[List[Any]]:
+        try:
+            return await self.browser.page.evaluate(_PAGE_STATE_SCRIPT)
+        except Exception:  # pragma: no cover - page mid-navigation
+            return None
+
+    async def _vision_action(self, screenshot_path: Path, task: str, image: Optional[bytes] = None) -> str:
+        """
+        Ask the vision model for the next action, reusing responses for near-identical frames.
+
+        When the encoded screenshot is passed as image, it is hashed and sent from memory
+        instead of being read back from screenshot_path.
+        """
+        source: Union[Path, bytes] = image if image is not None else screenshot_path
+        try:
+            frame_hash: Optional[int] = _dhash(source)
+        except Exception as exc:  # pragma: no cover - unreadable screenshot
+            logger.debug("[VisionActionAgent] dHash failed: %s", exc)
+            frame_hash = None
+        self._frame_hash = frame_hash
+
+        if frame_hash is not None:
+            for key, response in self._vision_cache.items():
+                cached_hash, cached_task = key
+                if cached_task == task and (frame_hash ^ cached_hash).bit_count() <= VISION_CACHE_MAX_DISTANCE:
+                    self._vision_cache.move_to_end(key)
+                    logger.debug("[VisionActionAgent] Vision cache hit for %s", screenshot_path)
+                    return response
+
+        response = await self._stream_vision_action(source, task)
+
+        if frame_hash is not None:
+            self._vision_cache[(frame_hash, task)] = response
+            if len(self._vision_cache) > VISION_CACHE_SIZE:
+                self._vision_cache.popitem(last=False)
+        return response
+
+    async def _stream_vision_action(self, screenshot: Union[Path, bytes], task: str) -> str:
+        """
+        Stream the vision response, starting selector probes as soon as a click target is known.
+
+        ACTION and TARGET are the first lines of the response format, so the probe fanout
+        for a click overlaps with the model generating REASON/CONFIDENCE.
+        """
+        stream = getattr(self.vision, "extract_browser_action_stream", None)
+        if stream is None:
+            return await self.vision.extract_browser_action(screenshot, task=task)
+
+        parts: List[str] = []
+        preflight_checked = False
+        async for chunk in stream(screenshot, task=task):
+            parts.append(chunk)
+            if preflight_checked or "\n" not in chunk:
+                continue
+            partial = "".join(parts)
+            target_at = partial.find("TARGET:")
+            if target_at < 0:
+                continue
+            line_end = partial.find("\n", target_at)
+            if line_end < 0:
+                continue
+            preflight_checked = True
+            action = self._parse_action(partial[:line_end])
+            if action.action_type == "click" and action.target:
+                self._start_preflight(action.target)
+        return "".join(parts)
+
+    def _start_preflight(self, description: str) -> None:
+        """Probe click selectors for description in the background."""
+        if not self.browser.page:
+            return
+        self._discard_preflight()
+        selectors = self._click_selectors(description)
+        task = asyncio.ensure_future(self._probe_selectors(selectors))
+        self._preflight = (description, selectors, task)
+
+    async def _take_preflight(self, description: str, selectors: Tuple[str, ...]) -> Optional[List[int]]:
+        """Return the preflight probe counts if they were made for these selectors."""
+        preflight, self._preflight = self._preflight, None
+        if preflight is None:
+            return None
+        pf_description, pf_selectors, task = preflight
+        if pf_description != description or pf_selectors != selectors:
+            task.cancel()
+            return None
+        try:
+            return await task
+        except Exception:
+            return None
+
+    def _discard_preflight(self) -> None:
+        if self._preflight is not None:
+            self._preflight[2].cancel()
+            self._preflight = None
 
     def _parse_action(self, vision_response: str) -> BrowserAction:
         """
@@ -258,13 +617,27 @@ class VisionActionAgent:
         VALUE: N/A
         REASON: need to click search to enter query
         CONFIDENCE: high
+
+        Keys may be preceded by whitespace, list markers ("1.", "2)", "-", "*"), "#" or
+        bold "**", e.g. "1. ACTION: click" or "- **TARGET:** search box".
         """
-        # Extract fields using regex
-        action_type = self._extract_field(vision_response, "ACTION", default="wait")
-        target = self._extract_field(vision_response, "TARGET", default="")
-        value = self._extract_field(vision_response, "VALUE", default=None)
-        reason = self._extract_field(vision_response, "REASON", default="")
-        confidence = self._extract_field(vision_response, "CONFIDENCE", default="medium")
+        # Single pass over the lines; the first occurrence of each field wins
+        fields: Dict[str, str] = {}
+        for line in vision_response.splitlines():
+            colon = line.find(":")
+            if colon < 0:
+                continue
+            key = _KEY_PREFIX_RE.sub("", line[:colon], count=1).rstrip(" *").upper()
+            if key in _ACTION_FIELDS and key not in fields:
+                value = line[colon + 1:].strip(" *").strip("[]").strip()
+                if value:
+                    fields[key] = value
+
+        action_type = fields.get("ACTION", "wait")
+        target = fields.get("TARGET", "")
+        value = fields.get("VALUE")
+        reason = fields.get("REASON", "")
+        confidence = fields.get("CONFIDENCE", "medium")
 
         # Clean up
         action_type = action_type.lower().strip()
@@ -279,8 +652,18 @@ class VisionActionAgent:
             confidence=confidence,
         )
 
-    async def _extract_phone_number(self, query: str) -> Optional[str]:
-        """Inspect the active page body and pull the best matching phone number."""
+    async def _extract_phone_number(self, query: str, captured: str = "") -> Optional[str]:
+        """
+        Pull the best matching phone number for the query.
+
+        Captured network response bodies are scanned first; the rendered page body is
+        only serialized over CDP when they contain no phone number.
+        """
+        if captured:
+            phone = self._best_phone(captured, query)
+            if phone:
+                return phone
+
         if not self.browser.page:
             return None
 
@@ -290,8 +673,12 @@ class VisionActionAgent:
             logger.warning("[VisionActionAgent] Failed to read body text: %s", exc)
             return None
 
-        matches = list(PHONE_REGEX.finditer(content))
-        if not matches:
+        return self._best_phone(content, query)
+
+    def _best_phone(self, content: str, query: str) -> Optional[str]:
+        """Score every phone-like match in content and return the best one, formatted."""
+        spans = _phone_spans(content)
+        if not spans:
             return None
 
         lowered = content.lower()
@@ -299,15 +686,15 @@ class VisionActionAgent:
         best_score = -1
         best_phone: Optional[str] = None
 
-        for match in matches:
-            raw = match.group(0).strip()
-            digits = re.sub(r"\D", "", raw)
+        for start, end in spans:
+            digits = content[start:end].encode("ascii", "ignore").translate(None, _NON_DIGITS).decode("ascii")
             score = 1
             if len(digits) >= 10:
                 score += 1
-            start, end = match.span()
-            snippet = lowered[max(0, start - 80) : min(len(lowered), end + 80)]
-            if any(token in snippet for token in query_tokens):
+            # Bounded str.find searches the context window without slicing it out
+            lo = max(0, start - _PHONE_CONTEXT)
+            hi = end + _PHONE_CONTEXT
+            if any(lowered.find(token, lo, hi) != -1 for token in query_tokens):
                 score += 2
             if score > best_score:
                 best_score = score
@@ -329,8 +716,12 @@ class VisionActionAgent:
         """Run a final screenshot through the vision QA prompt."""
         if not self.browser.page:
             return None
-        screenshot_path = self._screenshot_dir / "final_answer.png"
-        await self.browser.page.screenshot(path=str(screenshot_path), full_page=True)
+        screenshot_path = await self._reusable_frame()
+        if screenshot_path is None:
+            screenshot_path = self._screenshot_dir / "final_answer.jpg"
+            await self.browser.page.screenshot(
+                path=str(screenshot_path), full_page=True, type="jpeg", quality=80
+            )
         try:
             response = await self.vision.answer_question(screenshot_path, task)
             return response
@@ -338,16 +729,24 @@ class VisionActionAgent:
             logger.warning("[VisionActionAgent] Answer extraction failed: %s", exc)
             return None
 
-    def _extract_field(self, text: str, field_name: str, default: str = "") -> str:
-        """Extract field value from structured text."""
-        # Match "FIELD: value" or "FIELD: [value]"
-        pattern = rf"{field_name}:\s*\[?([^\]\n]+)\]?"
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            return match.group(1).strip()
+    async def _reusable_frame(self) -> Optional[Path]:
+        """
+        Return the last step screenshot if it already shows the whole page as it is now.
 
-        return default
+        The page must be unchanged (URL, height, scroll offset) and fit in the viewport,
+        otherwise a full-page capture would contain more than the step frame.
+        """
+        if not self._last_frame:
+            return None
+        path, state = self._last_frame
+        if not state or not path.exists():
+            return None
+        if await self._page_state() != state:
+            return None
+        _, scroll_height, scroll_y, viewport_height = state
+        if scroll_y or scroll_height > viewport_height:
+            return None
+        return path
 
     async def _perform_action(self, action: BrowserAction) -> None:
         """
@@ -359,45 +758,50 @@ class VisionActionAgent:
         if not self.browser.page:
             raise RuntimeError("Browser page not initialized")
 
-        page = self.browser.page
-
-        if action.action_type == "click":
-            # Try to click element by description
-            await self._click_by_description(action.target)
+        handler = self._action_handlers.get(action.action_type)
+        if handler is None:
+            logger.warning(f"[VisionActionAgent] Unknown action type: {action.action_type}")
+            return
+        try:
+            await handler(self.browser.page, action)
+        finally:
+            # Typing, focus rings or toasts barely move the dHash; replaying a response cached
+            # before the action is how the agent repeats the same click
+            if action.action_type not in _VISION_CACHE_SAFE_ACTIONS:
+                self._vision_cache.clear()
+
+    async def _do_click(self, page, action: BrowserAction) -> None:
+        # Try to click element by description
+        await self._click_by_description(action.target)
+
+    async def _do_type(self, page, action: BrowserAction) -> None:
+        # Type text into focused element
+        if action.value:
+            await page.keyboard.type(action.value)
+        else:
+            logger.warning("[VisionActionAgent] Type action has no value")
+
+    async def _do_scroll(self, page, action: BrowserAction) -> None:
+        direction = action.target.lower()
+        if "down" in direction:
+            await page.keyboard.press("PageDown")
+        elif "up" in direction:
+            await page.keyboard.press("PageUp")
+        else:
+            await page.mouse.wheel(0, 300)  # Default scroll
 
-        elif action.action_type == "type":
-            # Type text into focused element
-            if action.value:
-                await page.keyboard.type(action.value)
-            else:
-                logger.warning("[VisionActionAgent] Type action has no value")
-
-        elif action.action_type == "scroll":
-            # Scroll page
-            direction = action.target.lower()
-            if "down" in direction:
-                await page.keyboard.press("PageDown")
-            elif "up" in direction:
-                await page.keyboard.press("PageUp")
-            else:
-                await page.mouse.wheel(0, 300)  # Default scroll
-
-        elif action.action_type == "navigate":
-            # Navigate to URL
-            url = action.target
-            if not url.startswith("http"):
-                url = f"https://{url}"
-            await page.goto(url)
-
-        elif action.action_type == "wait":
-            # Wait for specified duration or page load
-            duration = 2  # Default wait
-            if action.value and action.value.isdigit():
-                duration = int(action.value)
-            await asyncio.sleep(duration)
+    async def _do_navigate(self, page, action: BrowserAction) -> None:
+        url = action.target
+        if not url.startswith("http"):
+            url = f"https://{url}"
+        await page.goto(url)
 
-        else:
-            logger.warning(f"[VisionActionAgent] Unknown action type: {action.action_type}")
+    async def _do_wait(self, page, action: BrowserAction) -> None:
+        # Wait for specified duration or page load
+        duration = 2  # Default wait
+        if action.value and action.value.isdigit():
+            duration = int(action.value)
+        await asyncio.sleep(duration)
 
     async def _click_by_description(self, description: str) -> None:
         """
@@ -410,63 +814,21 @@ class VisionActionAgent:
             raise RuntimeError("Browser page not initialized")
 
         page = self.browser.page
-
-        # Extract keywords from description
-        desc_lower = description.lower()
-
-        # Try common patterns
-        selectors = []
-
-        # Check for specific element types
-        if "button" in desc_lower:
-            # Look for buttons containing keywords
-            keywords = self._extract_keywords(description)
-            for kw in keywords:
-                selectors.extend([
-                    f"button:has-text('{kw}')",
-                    f"input[type='button']:has-text('{kw}')",
-                    f"input[type='submit']:has-text('{kw}')",
-                    f"a:has-text('{kw}')",
-                ])
-
-        elif "link" in desc_lower:
-            keywords = self._extract_keywords(description)
-            for kw in keywords:
-                selectors.append(f"a:has-text('{kw}')")
-
-        elif "input" in desc_lower or "field" in desc_lower or "search" in desc_lower:
-            # Look for input fields
-            if "search" in desc_lower:
-                selectors.extend([
-                    "input[type='search']",
-                    "input[placeholder*='search' i]",
-                    "input[name*='search' i]",
-                ])
-            else:
-                keywords = self._extract_keywords(description)
-                for kw in keywords:
-                    selectors.extend([
-                        f"input[placeholder*='{kw}' i]",
-                        f"input[name*='{kw}' i]",
-                    ])
-
-        else:
-            # Generic text search
-            keywords = self._extract_keywords(description)
-            for kw in keywords:
-                selectors.extend([
-                    f"text={kw}",
-                    f"*:has-text('{kw}')",
-                ])
-
-        # Try each selector
-        for selector in selectors:
+        selectors = self._click_selectors(description)
+
+        # Probe every selector in one concurrent round (possibly already done while the
+        # vision response streamed), then click matches in priority order
+        counts = await self._take_preflight(description, selectors)
+        if not counts or not any(counts):
+            counts = await self._probe_selectors(selectors)
+        for selector, count in zip(selectors, counts):
+            if not count:
+                continue
             try:
-                element = page.locator(selector).first
-                if await element.count() > 0:
-                    logger.debug(f"[VisionActionAgent] Clicking with selector: {selector}")
-                    await element.click(timeout=2000)
-                    return
+                logger.debug(f"[VisionActionAgent] Clicking with selector: {selector}")
+                await page.locator(selector).first.click(timeout=2000)
+                self._selector_cache[description] = selector
+                return
             except Exception as e:
                 logger.debug(f"[VisionActionAgent] Selector failed: {selector} ({e})")
                 continue
@@ -479,16 +841,26 @@ class VisionActionAgent:
             logger.warning(f"[VisionActionAgent] Could not find element: {description} ({e})")
             raise ValueError(f"Could not find element: {description}")
 
-    def _extract_keywords(self, description: str) -> List[str]:
-        """Extract meaningful keywords from description."""
-        # Remove common words
-        stop_words = {
-            "the", "a", "an", "in", "on", "at", "to", "for", "of", "with",
-            "button", "link", "input", "field", "box", "element",
-        }
+    def _click_selectors(self, description: str) -> Tuple[str, ...]:
+        """Candidate selectors for description, with the last winning selector first."""
+        selectors = _build_selectors(description)
+        cached = self._selector_cache.get(description)
+        if cached:
+            selectors = (cached,) + tuple(sel for sel in selectors if sel != cached)
+        return selectors
 
-        # Split and filter
-        words = description.lower().split()
-        keywords = [w.strip(".,!?\"'") for w in words if w not in stop_words]
+    async def _probe_selectors(self, selectors: Tuple[str, ...]) -> List[int]:
+        """Count matches for every selector concurrently (0 on error)."""
+        page = self.browser.page
+
+        async def probe(selector: str) -> int:
+            try:
+                return await page.locator(selector).first.count()
+            except Exception:
+                return 0
 
-        return keywords[:3]  # Return top 3 keywords
+        return list(await asyncio.gather(*(probe(sel) for sel in selectors)))
+
+    def _extract_keywords(self, description: str) -> List[str]:
+        """Extract meaningful keywords from description."""
+        return list(_extract_keywords(description))
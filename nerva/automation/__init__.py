@@ -1,6 +1,6 @@
 """Reusable automation playbooks."""
 
-from .playbooks import PlaybookStep, Playbook, PlaybookRunner
+from .playbooks import PlaybookStep, Playbook, PlaybookRunner, close_shared_browser
 from .playbooks_lookup import build_lookup_playbook
 from .playbooks_google import (
     build_calendar_day_playbook,
@@ -26,6 +26,7 @@ __all__ = [
     'PlaybookStep',
     'Playbook',
     'PlaybookRunner',
+    'close_shared_browser',
     'UIPlanner',
     'UIPlannerError',
     'UIStateExpectation',
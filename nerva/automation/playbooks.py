@@ -1,59 +1,274 @@
 """Declarative multi-step UI automation playbooks."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import re
+import sys
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 from nerva.tools.browser_automation import BrowserAutomation
 
 
-@dataclass
+# A param value of exactly "{{steps.<name>}}" or "{{steps.<name>[i]}}" is replaced at run time
+# with the result of an earlier step (or item i of it)
+_STEP_REF_RE = re.compile(r"\{\{steps\.(\w+)(?:\[(\d+)\])?\}\}")
+
+
+@dataclass(frozen=True)
 class PlaybookStep:
     """Single UI step with guard/check/selectors."""
 
-    name: str
+    name: Union[str, Tuple[str, int]]  # (prefix, index) is formatted lazily as "prefix_index"
     action: str
-    params: Dict[str, Any] = field(default_factory=dict)
-    wait_for: Optional[str] = None  # selector to confirm before continuing
+    params: Mapping[str, Any] = field(default_factory=dict)
+    wait_for: Optional[str] = None  # selector to confirm before continuing ("a || b" = any of)
+    wait_for_any: Tuple[str, ...] = ()  # alternative selectors raced in parallel; first one wins
     wait_timeout: Optional[int] = None
     description: Optional[str] = None
+    parallel_group: Optional[str] = None  # consecutive steps sharing a group run concurrently
+
+    def __post_init__(self) -> None:
+        # Actions are resolved with getattr() on every run; interned keys hit the fast dict path
+        object.__setattr__(self, "action", sys.intern(self.action))
+        if not isinstance(self.wait_for_any, tuple):
+            object.__setattr__(self, "wait_for_any", tuple(self.wait_for_any))
+        # Read-only so one step object can be shared by every playbook built from a template
+        if not isinstance(self.params, MappingProxyType):
+            object.__setattr__(self, "params", MappingProxyType(dict(self.params)))
+
+    @property
+    def display_name(self) -> str:
+        name = self.name
+        if isinstance(name, tuple):
+            return f"{name[0]}_{name[1]}"
+        return name
+
+
+@dataclass(frozen=True)
+class CompiledPlaybook:
+    """Struct-of-arrays view of a Playbook, indexed by step position."""
 
+    names: Tuple[str, ...]
+    actions: Tuple[str, ...]
+    params: Tuple[Mapping[str, Any], ...]
+    wait_fors: Tuple[Union[str, Tuple[str, ...], None], ...]  # a tuple means "any of"
+    wait_timeouts: Tuple[Optional[int], ...]
+    descriptions: Tuple[Optional[str], ...]
+    parallel_groups: Tuple[Optional[str], ...]
+    has_refs: Tuple[bool, ...]  # params reference earlier step results
 
-@dataclass
+    def __len__(self) -> int:
+        return len(self.actions)
+
+
+@dataclass(frozen=True)
 class Playbook:
-    """Collection of steps representing a workflow."""
+    """Collection of steps representing a workflow (immutable, so builders may cache it)."""
 
     name: str
-    steps: List[PlaybookStep]
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    steps: Tuple[PlaybookStep, ...]
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.steps, tuple):
+            object.__setattr__(self, "steps", tuple(self.steps))
+        # Builders pass module-level MappingProxyType singletons; wrap anything else the same way
+        if not isinstance(self.metadata, MappingProxyType):
+            object.__setattr__(self, "metadata", MappingProxyType(dict(self.metadata)))
+
+    def compile(self) -> CompiledPlaybook:
+        """Flatten the steps into parallel tuples for the runner's hot loop (computed once)."""
+        compiled = self.__dict__.get("_compiled")
+        if compiled is not None:
+            return compiled
+        steps = self.steps
+        compiled = CompiledPlaybook(
+            names=tuple(step.display_name for step in steps),
+            actions=tuple(sys.intern(step.action) for step in steps),
+            params=tuple(step.params for step in steps),
+            wait_fors=tuple(_wait_target(step) for step in steps),
+            wait_timeouts=tuple(step.wait_timeout for step in steps),
+            descriptions=tuple(step.description for step in steps),
+            parallel_groups=tuple(step.parallel_group for step in steps),
+            has_refs=tuple(
+                any(isinstance(v, str) and v.startswith("{{steps.") for v in step.params.values())
+                for step in steps
+            ),
+        )
+        object.__setattr__(self, "_compiled", compiled)
+        return compiled
+
+
+def _wait_target(step: PlaybookStep) -> Union[str, Tuple[str, ...], None]:
+    """Normalise wait_for / wait_for_any into one selector or a tuple of alternatives."""
+    selectors = tuple(step.wait_for_any)
+    if step.wait_for:
+        selectors += tuple(s.strip() for s in step.wait_for.split("||") if s.strip())
+    if not selectors:
+        return None
+    return selectors[0] if len(selectors) == 1 else selectors
+
+
+def instantiate_steps(template: Sequence[PlaybookStep], placeholder: str, value: str) -> Tuple[PlaybookStep, ...]:
+    """
+    Build steps from a module-level template, substituting value for placeholder.
+
+    Only steps whose string params contain the placeholder are copied; the rest are
+    shared by reference, so templates must not be mutated.
+    """
+    steps: List[PlaybookStep] = []
+    for step in template:
+        params = step.params
+        if any(isinstance(v, str) and placeholder in v for v in params.values()):
+            step = replace(
+                step,
+                params={k: v.replace(placeholder, value) if isinstance(v, str) else v for k, v in params.items()},
+            )
+        steps.append(step)
+    return tuple(steps)
+
+
+_SHARED_BROWSER: Optional[BrowserAutomation] = None
+_SHARED_BROWSER_LOCK = asyncio.Lock()
+
+
+async def _get_shared_browser() -> BrowserAutomation:
+    """Return the process-wide browser, starting it on first use."""
+    global _SHARED_BROWSER
+    async with _SHARED_BROWSER_LOCK:
+        if _SHARED_BROWSER is None:
+            _SHARED_BROWSER = BrowserAutomation(headless=False)
+        if not _SHARED_BROWSER.page:
+            await _SHARED_BROWSER.start()
+        return _SHARED_BROWSER
+
+
+async def close_shared_browser() -> None:
+    """Stop the shared browser used by ``PlaybookRunner(use_shared_browser=True)``."""
+    global _SHARED_BROWSER
+    async with _SHARED_BROWSER_LOCK:
+        if _SHARED_BROWSER is not None:
+            await _SHARED_BROWSER.stop()
+            _SHARED_BROWSER = None
 
 
 class PlaybookRunner:
     """Executes Playbook steps through BrowserAutomation."""
 
-    def __init__(self, browser: Optional[BrowserAutomation] = None) -> None:
-        self.browser = browser or BrowserAutomation(headless=False)
-        self._own_browser = browser is None
+    def __init__(
+        self,
+        browser: Optional[BrowserAutomation] = None,
+        *,
+        use_shared_browser: bool = False,
+    ) -> None:
+        self._use_shared_browser = use_shared_browser and browser is None
+        if self._use_shared_browser:
+            # Bound lazily in run(); the shared browser outlives this runner
+            self.browser: Optional[BrowserAutomation] = None
+            self._own_browser = False
+        else:
+            self.browser = browser or BrowserAutomation(headless=False)
+            self._own_browser = browser is None
+        # Bound browser methods keyed by action name, valid for _methods_browser only
+        self._methods: Dict[str, Callable[..., Any]] = {}
+        self._methods_browser: Optional[BrowserAutomation] = None
 
     async def run(self, playbook: Playbook) -> List[Dict[str, Any]]:
+        if self._use_shared_browser:
+            self.browser = await _get_shared_browser()
         if not self.browser.page:
             await self.browser.start()
+        # Helpers (e.g. consent dismissal) defined once per context instead of sent per step
+        for script in playbook.metadata.get("init_scripts", ()):
+            await self.browser.add_init_script(script)
+        if self._methods_browser is not self.browser:
+            self._methods.clear()
+            self._methods_browser = self.browser
         results: List[Dict[str, Any]] = []
-        for step in playbook.steps:
-            outcome = {"step": step.name, "action": step.action, "status": "pending"}
-            try:
-                if step.wait_for:
-                    await self.browser.wait_for_selector(
-                        step.wait_for, timeout=step.wait_timeout or 45000
-                    )
-                method = getattr(self.browser, step.action)
-                result = await method(**step.params)
-                outcome["result"] = result
-                outcome["status"] = "ok"
-            except Exception as exc:  # pragma: no cover - runtime failures
-                outcome["status"] = "error"
-                outcome["error"] = str(exc)
-            results.append(outcome)
+        outputs: Dict[str, Any] = {}
+        compiled = playbook.compile()
+        groups = compiled.parallel_groups
+        count = len(compiled)
+        i = 0
+        while i < count:
+            group = groups[i]
+            j = i + 1
+            if group is not None:
+                while j < count and groups[j] == group:
+                    j += 1
+            if j - i == 1:
+                results.append(await self._run_one(compiled, i, outputs))
+            else:
+                results.extend(
+                    await asyncio.gather(*(self._run_one(compiled, k, outputs) for k in range(i, j)))
+                )
+            i = j
         if self._own_browser:
             await self.browser.stop()
         return results
+
+    async def _run_one(self, compiled: CompiledPlaybook, index: int, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        action = compiled.actions[index]
+        name = compiled.names[index]
+        outcome = {"step": name, "action": action, "status": "pending"}
+        try:
+            params = compiled.params[index]
+            if compiled.has_refs[index]:
+                params = self._resolve_refs(params, outputs)
+            wait_for = compiled.wait_fors[index]
+            if wait_for:
+                await self._wait_for(wait_for, compiled.wait_timeouts[index] or 45000)
+            method = self._methods.get(action)
+            if method is None:
+                method = self._methods[action] = getattr(self.browser, action)
+            result = await method(**params)
+            outcome["result"] = result
+            outcome["status"] = "ok"
+            outputs[name] = result
+        except Exception as exc:  # pragma: no cover - runtime failures
+            outcome["status"] = "error"
+            outcome["error"] = str(exc)
+        return outcome
+
+    @staticmethod
+    def _resolve_refs(params: Mapping[str, Any], outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Substitute "{{steps.<name>[i]}}" params with earlier step results."""
+        resolved = dict(params)
+        for key, value in params.items():
+            if not isinstance(value, str):
+                continue
+            match = _STEP_REF_RE.fullmatch(value)
+            if not match:
+                continue
+            step_name, item = match.groups()
+            if step_name not in outputs:
+                raise LookupError(f"No result from step '{step_name}'")
+            result = outputs[step_name]
+            if item is not None:
+                try:
+                    result = result[int(item)]
+                except (IndexError, KeyError, TypeError):
+                    raise LookupError(f"Step '{step_name}' has no item {item}") from None
+            resolved[key] = result
+        return resolved
+
+    async def _wait_for(self, wait_for: Union[str, Tuple[str, ...]], timeout: int) -> bool:
+        """Wait for a selector, or for whichever of several alternative selectors appears first."""
+        if isinstance(wait_for, str):
+            return await self.browser.wait_for_selector(wait_for, timeout=timeout)
+
+        pending = {
+            asyncio.ensure_future(self.browser.wait_for_selector(selector, timeout=timeout))
+            for selector in wait_for
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(not task.exception() and task.result() for task in done):
+                    return True
+            return False
+        finally:
+            for task in pending:
+                task.cancel()
@@ -1,9 +1,14 @@
 """Generic login/form playbooks."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from .playbooks import Playbook, PlaybookStep
 
 
+_LOGIN_META = MappingProxyType({"description": "Fill username/password and submit"})
+
+
 def build_login_playbook(
     url: str,
     username_selector: str,
@@ -14,8 +19,8 @@ def build_login_playbook(
 ) -> Playbook:
     return Playbook(
         name="generic_login",
-        metadata={"description": "Fill username/password and submit"},
-        steps=[
+        metadata=_LOGIN_META,
+        steps=(
             PlaybookStep(
                 name="goto_login",
                 action="navigate",
@@ -37,36 +42,36 @@ def build_login_playbook(
                 action="click",
                 params={"selector": submit_selector},
             ),
-        ],
+        ),
     )
 
 
+_FORM_SUBMISSION_META = MappingProxyType({"description": "Fill arbitrary form fields and submit"})
+
+
 def build_form_submission_playbook(url: str, field_map: dict, submit_selector: str) -> Playbook:
-    steps = [
-        PlaybookStep(
-            name="goto_form",
-            action="navigate",
-            params={"url": url},
-            wait_for=list(field_map.keys())[0],
-        )
-    ]
-    for name, value in field_map.items():
-        steps.append(
-            PlaybookStep(
-                name=f"fill_{name}",
-                action="fill",
-                params={"selector": name, "text": value},
-            )
-        )
-    steps.append(
-        PlaybookStep(
-            name="submit_form",
-            action="click",
-            params={"selector": submit_selector},
-        )
-    )
     return Playbook(
         name="generic_form",
-        metadata={"description": "Fill arbitrary form fields and submit"},
-        steps=steps,
+        metadata=_FORM_SUBMISSION_META,
+        steps=(
+            PlaybookStep(
+                name="goto_form",
+                action="navigate",
+                params={"url": url},
+                wait_for=next(iter(field_map)),
+            ),
+            *(
+                PlaybookStep(
+                    name=f"fill_{name}",
+                    action="fill",
+                    params={"selector": name, "text": value},
+                )
+                for name, value in field_map.items()
+            ),
+            PlaybookStep(
+                name="submit_form",
+                action="click",
+                params={"selector": submit_selector},
+            ),
+        ),
     )
@@ -1,312 +1,470 @@
 """Pre-built Google workspace playbooks."""
 from __future__ import annotations
 
-from .playbooks import Playbook, PlaybookStep
+from functools import lru_cache
+from types import MappingProxyType
 
+from .playbooks import Playbook, PlaybookStep, instantiate_steps
+from .selectors import (
+    GBUTTON_FMT,
+    GCOMPOSE,
+    GDRIVE_SEARCH_BOX,
+    GLABEL_FMT,
+    GMAIN,
+    GMAIN_ROW,
+    GREPLY,
+    GROW_CHECKBOX,
+)
 
+# Step templates are built once at import; builders share the step objects and only
+# copy steps that carry a placeholder ("__QUERY__", "__LABEL__", ...). Playbooks are
+# immutable, so builders also cache them per argument tuple.
+
+_CALENDAR_DAY_STEPS = (
+    PlaybookStep(
+        name="goto_calendar",
+        action="navigate",
+        params={"url": "https://calendar.google.com/calendar/u/0/r/day"},
+        wait_for=GMAIN,
+    ),
+)
+
+
+_CALENDAR_DAY_META = MappingProxyType({"description": "Open Google Calendar day view"})
+
+
+@lru_cache(maxsize=1)
 def build_calendar_day_playbook() -> Playbook:
     return Playbook(
         name="calendar_day",
-        metadata={"description": "Open Google Calendar day view"},
-        steps=[
-            PlaybookStep(
-                name="goto_calendar",
-                action="navigate",
-                params={"url": "https://calendar.google.com/calendar/u/0/r/day"},
-                wait_for="div[role='main']",
-            ),
-        ],
+        metadata=_CALENDAR_DAY_META,
+        steps=_CALENDAR_DAY_STEPS,
     )
 
 
+_CALENDAR_EVENT_STEPS = (
+    PlaybookStep(
+        name="event_edit",
+        action="navigate",
+        params={"url": "https://calendar.google.com/calendar/u/0/r/eventedit"},
+        # Raced as separate waits rather than one comma-joined selector
+        wait_for_any=(
+            "input[aria-label*='title' i]",
+            "textarea[aria-label*='title' i]",
+            "div[aria-label*='title' i]",
+            "[aria-label*='title and time' i]",
+        ),
+    ),
+)
+
+
+_CALENDAR_EVENT_META = MappingProxyType({"description": "Open the event editor"})
+
+
+@lru_cache(maxsize=1)
 def build_calendar_event_playbook() -> Playbook:
     return Playbook(
         name="calendar_event",
-        metadata={"description": "Open the event editor"},
-        steps=[
-            PlaybookStep(
-                name="event_edit",
-                action="navigate",
-                params={"url": "https://calendar.google.com/calendar/u/0/r/eventedit"},
-                wait_for=(
-                    "input[aria-label*='title' i], textarea[aria-label*='title' i], "
-                    "div[aria-label*='title' i], [aria-label*='title and time' i]"
-                ),
-            ),
-        ],
+        metadata=_CALENDAR_EVENT_META,
+        steps=_CALENDAR_EVENT_STEPS,
     )
 
 
+_GMAIL_INBOX_STEPS = (
+    PlaybookStep(
+        name="goto_gmail",
+        action="navigate",
+        params={"url": "https://mail.google.com/mail/u/0/#inbox"},
+        wait_for=GMAIN,
+    ),
+)
+
+
+_GMAIL_INBOX_META = MappingProxyType({"description": "Open Gmail inbox"})
+
+
+@lru_cache(maxsize=1)
 def build_gmail_inbox_playbook() -> Playbook:
     return Playbook(
         name="gmail_inbox",
-        metadata={"description": "Open Gmail inbox"},
-        steps=[
-            PlaybookStep(
-                name="goto_gmail",
-                action="navigate",
-                params={"url": "https://mail.google.com/mail/u/0/#inbox"},
-                wait_for="div[role='main']",
-            ),
-        ],
+        metadata=_GMAIL_INBOX_META,
+        steps=_GMAIL_INBOX_STEPS,
     )
 
 
+_GMAIL_COMPOSE_STEPS = (
+    PlaybookStep(
+        name="open_inbox",
+        action="navigate",
+        params={"url": "https://mail.google.com/mail/u/0/#inbox"},
+    ),
+    # Wait for the compose button itself; Gmail's long-polling rarely lets networkidle settle
+    PlaybookStep(
+        name="click_compose",
+        action="click",
+        params={"selector": GCOMPOSE, "timeout": 5000},
+        wait_for=GCOMPOSE,
+        wait_timeout=30000,
+    ),
+)
+
+
+_GMAIL_COMPOSE_META = MappingProxyType({"description": "Open Gmail compose dialog"})
+
+
+@lru_cache(maxsize=1)
 def build_gmail_compose_playbook() -> Playbook:
     return Playbook(
         name="gmail_compose",
-        metadata={"description": "Open Gmail compose dialog"},
-        steps=[
-            PlaybookStep(
-                name="open_inbox",
-                action="navigate",
-                params={"url": "https://mail.google.com/mail/u/0/#inbox", "wait_until": "networkidle"},
-            ),
-            PlaybookStep(
-                name="click_compose",
-                action="click",
-                params={"selector": "div[gh='cm']", "timeout": 30000},
-            ),
-        ],
+        metadata=_GMAIL_COMPOSE_META,
+        steps=_GMAIL_COMPOSE_STEPS,
     )
 
 
+_DRIVE_MAIN_STEPS = (
+    PlaybookStep(
+        name="goto_drive",
+        action="navigate",
+        params={"url": "https://drive.google.com/drive/u/0/my-drive"},
+        wait_for=GMAIN,
+    ),
+)
+
+
+_DRIVE_MAIN_META = MappingProxyType({"description": "Open Google Drive main view"})
+
+
+@lru_cache(maxsize=1)
 def build_drive_main_playbook() -> Playbook:
     return Playbook(
         name="drive_main",
-        metadata={"description": "Open Google Drive main view"},
-        steps=[
-            PlaybookStep(
-                name="goto_drive",
-                action="navigate",
-                params={"url": "https://drive.google.com/drive/u/0/my-drive"},
-                wait_for="div[role='main']",
-            ),
-        ],
+        metadata=_DRIVE_MAIN_META,
+        steps=_DRIVE_MAIN_STEPS,
     )
 
 
+_DRIVE_SEARCH_STEPS = (
+    PlaybookStep(
+        name="goto_drive",
+        action="navigate",
+        params={"url": "https://drive.google.com/drive/u/0/my-drive"},
+        wait_for=GDRIVE_SEARCH_BOX,
+    ),
+    PlaybookStep(
+        name="enter_query",
+        action="fill",
+        params={"selector": GDRIVE_SEARCH_BOX, "text": "__QUERY__"},
+    ),
+    PlaybookStep(
+        name="submit_search",
+        action="press",
+        params={"selector": GDRIVE_SEARCH_BOX, "key": "Enter"},
+    ),
+    PlaybookStep(
+        name="wait_results",
+        action="wait_for_selector",
+        params={"selector": GMAIN, "timeout": 15000},
+    ),
+)
+
+
+_DRIVE_SEARCH_META = MappingProxyType({"description": "Search within Google Drive"})
+
+
+@lru_cache(maxsize=256)
 def build_drive_search_playbook(query: str) -> Playbook:
     return Playbook(
         name=f"drive_search:{query}",
-        metadata={"description": "Search within Google Drive"},
-        steps=[
-            PlaybookStep(
-                name="goto_drive",
-                action="navigate",
-                params={"url": "https://drive.google.com/drive/u/0/my-drive"},
-                wait_for="input[aria-label='Search in Drive']",
-            ),
-            PlaybookStep(
-                name="enter_query",
-                action="fill",
-                params={"selector": "input[aria-label='Search in Drive']", "text": query},
-            ),
-            PlaybookStep(
-                name="submit_search",
-                action="evaluate",
-                params={"script": "document.querySelector('input[aria-label=\"Search in Drive\"]').form.submit();"},
-            ),
-            PlaybookStep(
-                name="wait_results",
-                action="wait_for_selector",
-                params={"selector": "div[role='main']", "timeout": 15000},
-            ),
-        ],
+        metadata=_DRIVE_SEARCH_META,
+        steps=instantiate_steps(_DRIVE_SEARCH_STEPS, "__QUERY__", query),
     )
 
-def build_gmail_archive_playbook() -> Playbook:
-    ...
 
-def build_gmail_archive_playbook() -> Playbook:
+# Select the first inbox row and press a toolbar button in one evaluate. Gmail buttons react
+# to mouse down/up rather than click, and the toolbar only becomes visible after selection,
+# so the button is polled once per animation frame (up to ~2s).
+_GMAIL_SELECT_FIRST_AND_PRESS_SCRIPT = """
+(async () => {
+    const press = (el) => ['mousedown', 'mouseup', 'click'].forEach(
+        (type) => el.dispatchEvent(new MouseEvent(type, {bubbles: true}))
+    );
+    const box = document.querySelector("div[role='row'] div[role='checkbox']");
+    if (!box) throw new Error('No inbox row to select');
+    press(box);
+    for (let frame = 0; frame < 120; frame++) {
+        await new Promise((resolve) => requestAnimationFrame(resolve));
+        const button = document.querySelector("div[aria-label='__BUTTON__']");
+        if (button && button.offsetParent !== null) {
+            press(button);
+            return true;
+        }
+    }
+    throw new Error("Button '__BUTTON__' did not appear");
+})()
+""".strip()
+
+_GMAIL_SELECT_FIRST_AND_PRESS_STEPS = (
+    PlaybookStep(
+        name="open_inbox",
+        action="navigate",
+        params={"url": "https://mail.google.com/mail/u/0/#inbox"},
+        wait_for=GMAIN,
+    ),
+    PlaybookStep(
+        name="select_first_and_press",
+        action="evaluate",
+        params={"script": _GMAIL_SELECT_FIRST_AND_PRESS_SCRIPT},
+    ),
+)
+
+# Step-by-step variants (safe=True): one Playwright click per element, easier to debug
+_GMAIL_ARCHIVE_STEPS = (
+    PlaybookStep(
+        name="open_inbox",
+        action="navigate",
+        params={"url": "https://mail.google.com/mail/u/0/#inbox"},
+        wait_for=GMAIN,
+    ),
+    PlaybookStep(
+        name="select_first",
+        action="click",
+        params={"selector": GROW_CHECKBOX},
+    ),
+    PlaybookStep(
+        name="archive",
+        action="click",
+        params={"selector": GBUTTON_FMT.format("Archive")},
+    ),
+)
+
+
+_GMAIL_ARCHIVE_META = MappingProxyType({"description": "Archive the first inbox message"})
+
+
+@lru_cache(maxsize=2)
+def build_gmail_archive_playbook(safe: bool = False) -> Playbook:
     return Playbook(
         name="gmail_archive",
-        metadata={"description": "Archive the first inbox message"},
-        steps=[
-            PlaybookStep(
-                name="open_inbox",
-                action="navigate",
-                params={"url": "https://mail.google.com/mail/u/0/#inbox"},
-                wait_for="div[role='main']",
-            ),
-            PlaybookStep(
-                name="select_first",
-                action="click",
-                params={"selector": "div[role='row'] div[role='checkbox']"},
-            ),
-            PlaybookStep(
-                name="archive",
-                action="click",
-                params={"selector": "div[aria-label='Archive']"},
-            ),
-        ],
+        metadata=_GMAIL_ARCHIVE_META,
+        steps=(
+            _GMAIL_ARCHIVE_STEPS
+            if safe
+            else instantiate_steps(_GMAIL_SELECT_FIRST_AND_PRESS_STEPS, "__BUTTON__", "Archive")
+        ),
     )
 
 
-def build_gmail_mark_read_playbook(mark_read: bool = True) -> Playbook:
+_GMAIL_TOGGLE_READ_STEPS = (
+    PlaybookStep(
+        name="open_inbox",
+        action="navigate",
+        params={"url": "https://mail.google.com/mail/u/0/#inbox"},
+        wait_for=GMAIN,
+    ),
+    PlaybookStep(
+        name="select_first",
+        action="click",
+        params={"selector": GROW_CHECKBOX},
+    ),
+    PlaybookStep(
+        name="toggle",
+        action="click",
+        params={"selector": GBUTTON_FMT.format("__BUTTON__")},
+    ),
+)
+
+
+@lru_cache(maxsize=4)
+def build_gmail_mark_read_playbook(mark_read: bool = True, safe: bool = False) -> Playbook:
     button = "Mark as read" if mark_read else "Mark as unread"
+    template = _GMAIL_TOGGLE_READ_STEPS if safe else _GMAIL_SELECT_FIRST_AND_PRESS_STEPS
     return Playbook(
         name=f"gmail_mark_{'read' if mark_read else 'unread'}",
         metadata={"description": f"Mark first message as {button}"},
-        steps=[
-            PlaybookStep(
-                name="open_inbox",
-                action="navigate",
-                params={"url": "https://mail.google.com/mail/u/0/#inbox"},
-                wait_for="div[role='main']",
-            ),
-            PlaybookStep(
-                name="select_first",
-                action="click",
-                params={"selector": "div[role='row'] div[role='checkbox']"},
-            ),
-            PlaybookStep(
-                name="toggle",
-                action="click",
-                params={"selector": f"div[aria-label='{button}']"},
-            ),
-        ],
+        steps=instantiate_steps(template, "__BUTTON__", button),
     )
 
 
+_GMAIL_LABEL_STEPS = (
+    PlaybookStep(
+        name="open_inbox",
+        action="navigate",
+        params={"url": "https://mail.google.com/mail/u/0/#inbox"},
+        wait_for=GMAIN,
+    ),
+    PlaybookStep(
+        name="open_label",
+        action="click",
+        params={"selector": GLABEL_FMT.format("__LABEL__")},
+    ),
+)
+
+
+@lru_cache(maxsize=256)
 def build_gmail_label_playbook(label: str) -> Playbook:
     return Playbook(
         name=f"gmail_label:{label}",
         metadata={"description": f"Open Gmail label {label}"},
-        steps=[
-            PlaybookStep(
-                name="open_inbox",
-                action="navigate",
-                params={"url": "https://mail.google.com/mail/u/0/#inbox"},
-                wait_for="div[role='main']",
-            ),
-            PlaybookStep(
-                name="open_label",
-                action="click",
-                params={"selector": f"a[title='{label}']"},
-            ),
-        ],
+        steps=instantiate_steps(_GMAIL_LABEL_STEPS, "__LABEL__", label),
     )
 
 
+_GMAIL_REPLY_STEPS = (
+    PlaybookStep(
+        name="open_inbox",
+        action="navigate",
+        params={"url": "https://mail.google.com/mail/u/0/#inbox"},
+        wait_for=GMAIN,
+    ),
+    PlaybookStep(
+        name="open_first_email",
+        action="click",
+        params={"selector": GMAIN_ROW},
+        wait_for=GREPLY,
+    ),
+    PlaybookStep(
+        name="reply",
+        action="click",
+        params={"selector": GREPLY, "skip_scroll_if_visible": True},
+    ),
+)
+
+
+_GMAIL_REPLY_META = MappingProxyType({"description": "Open first email and click reply"})
+
+
+@lru_cache(maxsize=1)
 def build_gmail_reply_playbook() -> Playbook:
     return Playbook(
         name="gmail_reply",
-        metadata={"description": "Open first email and click reply"},
-        steps=[
-            PlaybookStep(
-                name="open_inbox",
-                action="navigate",
-                params={"url": "https://mail.google.com/mail/u/0/#inbox"},
-                wait_for="div[role='main']",
-            ),
-            PlaybookStep(
-                name="open_first_email",
-                action="click",
-                params={"selector": "div[role='main'] tr"},
-                wait_for="div[aria-label='Reply']",
-            ),
-            PlaybookStep(
-                name="reply",
-                action="click",
-                params={"selector": "div[aria-label='Reply']"},
-            ),
-        ],
+        metadata=_GMAIL_REPLY_META,
+        steps=_GMAIL_REPLY_STEPS,
     )
 
+
+_DRIVE_UPLOAD_STEPS = (
+    PlaybookStep(
+        name="goto_drive",
+        action="navigate",
+        params={"url": "https://drive.google.com/drive/u/0/my-drive"},
+        wait_for=GMAIN,
+    ),
+    PlaybookStep(
+        name="click_new",
+        action="click",
+        params={"selector": "button[aria-label='New']"},
+    ),
+    PlaybookStep(
+        name="select_upload",
+        action="click",
+        params={"selector": "div[role='menuitem'][data-tooltip='File upload']"},
+    ),
+)
+
+
+_DRIVE_UPLOAD_META = MappingProxyType({"description": "Upload a file to Google Drive"})
+
+
+@lru_cache(maxsize=256)
 def build_drive_upload_playbook(file_input_selector: str = "input[type='file']", file_path: str = "") -> Playbook:
     return Playbook(
         name="drive_upload",
-        metadata={"description": "Upload a file to Google Drive"},
-        steps=[
-            PlaybookStep(
-                name="goto_drive",
-                action="navigate",
-                params={"url": "https://drive.google.com/drive/u/0/my-drive"},
-                wait_for="div[role='main']",
-            ),
-            PlaybookStep(
-                name="click_new",
-                action="click",
-                params={"selector": "button[aria-label='New']"},
-            ),
-            PlaybookStep(
-                name="select_upload",
-                action="click",
-                params={"selector": "div[role='menuitem'][data-tooltip='File upload']"},
-            ),
+        metadata=_DRIVE_UPLOAD_META,
+        steps=(
+            *_DRIVE_UPLOAD_STEPS,
             PlaybookStep(
                 name="upload_file",
                 action="upload",
                 params={"selector": file_input_selector, "file_path": file_path},
             ),
-        ],
+        ),
     )
 
 
+_DRIVE_SHARE_STEPS = (
+    PlaybookStep(
+        name="goto_drive",
+        action="navigate",
+        params={"url": "https://drive.google.com/drive/u/0/my-drive"},
+        wait_for=GMAIN,
+    ),
+    PlaybookStep(
+        name="select_first_item",
+        action="click",
+        params={"selector": "div[role='grid'] div[role='gridcell']"},
+    ),
+    PlaybookStep(
+        name="open_share",
+        action="click",
+        params={"selector": "div[aria-label='Share']"},
+        wait_for="div[aria-label='Add people or groups']",
+    ),
+)
+
+
+_DRIVE_SHARE_META = MappingProxyType({"description": "Share the first Drive item"})
+
+
+@lru_cache(maxsize=1)
 def build_drive_share_playbook() -> Playbook:
     return Playbook(
         name="drive_share",
-        metadata={"description": "Share the first Drive item"},
-        steps=[
-            PlaybookStep(
-                name="goto_drive",
-                action="navigate",
-                params={"url": "https://drive.google.com/drive/u/0/my-drive"},
-                wait_for="div[role='main']",
-            ),
-            PlaybookStep(
-                name="select_first_item",
-                action="click",
-                params={"selector": "div[role='grid'] div[role='gridcell']"},
-            ),
-            PlaybookStep(
-                name="open_share",
-                action="click",
-                params={"selector": "div[aria-label='Share']"},
-                wait_for="div[aria-label='Add people or groups']",
-            ),
-        ],
+        metadata=_DRIVE_SHARE_META,
+        steps=_DRIVE_SHARE_STEPS,
     )
 
 
+_CALENDAR_WEEK_STEPS = (
+    PlaybookStep(
+        name="goto_week",
+        action="navigate",
+        params={"url": "https://calendar.google.com/calendar/u/0/r/week"},
+        wait_for=GMAIN,
+    ),
+)
+
+
+_CALENDAR_WEEK_META = MappingProxyType({"description": "Open Google Calendar week view"})
+
+
+@lru_cache(maxsize=1)
 def build_calendar_week_playbook() -> Playbook:
     return Playbook(
         name="calendar_week",
-        metadata={"description": "Open Google Calendar week view"},
-        steps=[
-            PlaybookStep(
-                name="goto_week",
-                action="navigate",
-                params={"url": "https://calendar.google.com/calendar/u/0/r/week"},
-                wait_for="div[role='main']",
-            ),
-        ],
+        metadata=_CALENDAR_WEEK_META,
+        steps=_CALENDAR_WEEK_STEPS,
     )
 
 
+_CALENDAR_RESCHEDULE_STEPS = (
+    PlaybookStep(
+        name="open_week",
+        action="navigate",
+        params={"url": "https://calendar.google.com/calendar/u/0/r/week"},
+        wait_for=GMAIN,
+    ),
+    PlaybookStep(
+        name="open_first_event",
+        action="click",
+        params={"selector": "div[role='button'][data-eventid]"},
+        wait_for="div[role='dialog']",
+    ),
+    PlaybookStep(
+        name="edit_event",
+        action="click",
+        params={"selector": "button[id*='edit-button']"},
+        wait_for="input[aria-label='Add title']",
+    ),
+)
+
+
+_CALENDAR_RESCHEDULE_META = MappingProxyType({"description": "Open week view and edit the first event"})
+
+
+@lru_cache(maxsize=1)
 def build_calendar_reschedule_playbook() -> Playbook:
     return Playbook(
         name="calendar_reschedule",
-        metadata={"description": "Open week view and edit the first event"},
-        steps=[
-            PlaybookStep(
-                name="open_week",
-                action="navigate",
-                params={"url": "https://calendar.google.com/calendar/u/0/r/week"},
-                wait_for="div[role='main']",
-            ),
-            PlaybookStep(
-                name="open_first_event",
-                action="click",
-                params={"selector": "div[role='button'][data-eventid]"},
-                wait_for="div[role='dialog']",
-            ),
-            PlaybookStep(
-                name="edit_event",
-                action="click",
-                params={"selector": "button[id*='edit-button']"},
-                wait_for="input[aria-label='Add title']",
-            ),
-        ],
+        metadata=_CALENDAR_RESCHEDULE_META,
+        steps=_CALENDAR_RESCHEDULE_STEPS,
     )
@@ -1,37 +1,29 @@
 from __future__ import annotations
 
-from urllib.parse import quote_plus
+from functools import lru_cache
+from types import MappingProxyType
 
-from .playbooks import Playbook, PlaybookStep
+from .playbooks import Playbook, PlaybookStep, instantiate_steps
+from .selectors import GSEARCH_RESULT_LINK, GSEARCH_RESULTS
 
 
-CONSENT_SCRIPT = """
-(() => {
+CONSENT_FUNCTION = """
+() => {
+    // One combined selector: a single DOM traversal covers the known ids and aria-labels
+    const CONSENT_SELECTOR = "#L2AGLb, #introAgreeButton, "
+        + "button[aria-label*='accept' i], button[aria-label*='agree' i]";
+    const keywords = ['accept', 'agree'];  // 'accept' also covers 'accept all'
     const clickMatches = (root) => {
-        if (!root) return false;
-        const ids = ['L2AGLb', 'introAgreeButton'];
-        for (const id of ids) {
-            const byId = root.getElementById ? root.getElementById(id) : null;
-            if (byId) {
-                byId.click();
-                return true;
-            }
-            const query = root.querySelector ? root.querySelector(`#${id}`) : null;
-            if (query) {
-                query.click();
-                return true;
-            }
+        if (!root || !root.querySelector) return false;
+        const match = root.querySelector(CONSENT_SELECTOR);
+        if (match) {
+            match.click();
+            return true;
         }
-        const ariaLabels = ['accept all', 'accept', 'agree'];
-        const buttons = root.querySelectorAll ? Array.from(root.querySelectorAll('button')) : [];
-        for (const btn of buttons) {
-            const label = (btn.getAttribute('aria-label') || '').toLowerCase();
-            if (ariaLabels.some(text => label.includes(text))) {
-                btn.click();
-                return true;
-            }
+        // Text scan only when no id/aria-label matched
+        for (const btn of root.querySelectorAll('button')) {
             const text = (btn.textContent || '').trim().toLowerCase();
-            if (text && ariaLabels.some(keyword => text.includes(keyword))) {
+            if (text && keywords.some(keyword => text.includes(keyword))) {
                 btn.click();
                 return true;
             }
@@ -53,42 +45,63 @@ CONSENT_SCRIPT = """
     }
 
     return false;
-})()
+}
 """.strip()
 
-def build_lookup_playbook(query: str) -> Playbook:
-    encoded = quote_plus(query)
-    search_url = f"https://www.google.com/search?q={encoded}&hl=en&gl=us"
+# Self-contained IIFE, for executors that cannot register init scripts
+CONSENT_SCRIPT = f"({CONSENT_FUNCTION})()"
+# Registered once per browser context, so each step only sends a short call over CDP
+CONSENT_INIT_SCRIPT = f"window.__nervaDismissConsent = {CONSENT_FUNCTION};"
+CONSENT_CALL = "window.__nervaDismissConsent && window.__nervaDismissConsent()"
 
-    steps = [
-        PlaybookStep(
-            name="goto_results",
-            action="navigate",
-            params={"url": search_url},
-            wait_for="body",
-            wait_timeout=60000,
-        ),
-        PlaybookStep(
-            name="dismiss_consent",
-            action="evaluate",
-            params={"script": CONSENT_SCRIPT},
-        ),
-        PlaybookStep(
-            name="wait_results",
-            action="wait_for_selector",
-            params={"selector": "#search", "timeout": 60000},
-        ),
-        PlaybookStep(
-            name="open_first_result",
-            action="click",
-            params={"selector": "#search a"},
-            wait_for="body",
-            wait_timeout=60000,
-        ),
-    ]
+@lru_cache(maxsize=2048)
+def quote_query(text: str) -> str:
+    """quote_plus, memoized; voice commands repeat the same few queries."""
+    # Imported on first use so entry points that never build a lookup skip urllib.parse
+    from urllib.parse import quote_plus
 
+    return quote_plus(text)
+
+
+_LOOKUP_STEPS = (
+    PlaybookStep(
+        name="goto_results",
+        action="navigate",
+        params={"url": "https://www.google.com/search?q=__QUERY__&hl=en&gl=us"},
+        wait_for="body",
+        wait_timeout=60000,
+    ),
+    PlaybookStep(
+        name="dismiss_consent",
+        action="evaluate",
+        params={"script": CONSENT_CALL},
+    ),
+    PlaybookStep(
+        name="wait_results",
+        action="wait_for_selector",
+        params={"selector": GSEARCH_RESULTS, "timeout": 60000},
+    ),
+    PlaybookStep(
+        name="open_first_result",
+        action="click",
+        params={"selector": GSEARCH_RESULT_LINK, "skip_scroll_if_visible": True},
+        wait_for="body",
+        wait_timeout=60000,
+    ),
+)
+
+_LOOKUP_META = MappingProxyType(
+    {
+        "description": "Open Google results for a query and drill into first link",
+        "init_scripts": (CONSENT_INIT_SCRIPT,),
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def build_lookup_playbook(query: str) -> Playbook:
     return Playbook(
         name=f"lookup:{query}",
-        metadata={"description": "Open Google results for a query and drill into first link"},
-        steps=steps,
+        metadata=_LOOKUP_META,
+        steps=instantiate_steps(_LOOKUP_STEPS, "__QUERY__", quote_query(query)),
     )
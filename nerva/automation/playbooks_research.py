@@ -1,66 +1,76 @@
 """Playbooks for multi-result research and SERP extraction."""
 from __future__ import annotations
 
-from .playbooks import Playbook, PlaybookStep
+from functools import lru_cache
+from types import MappingProxyType
 
+from .playbooks import Playbook, PlaybookStep, instantiate_steps
+from .playbooks_lookup import CONSENT_CALL, CONSENT_INIT_SCRIPT, quote_query
+from .selectors import GSEARCH_RESULTS
 
+
+_SEARCH_STEPS = (
+    # Google accepts the query in the URL, so skip loading the homepage and typing into it
+    PlaybookStep(
+        name="goto_results",
+        action="navigate",
+        params={"url": "https://www.google.com/search?q=__QUERY__&hl=en"},
+    ),
+    PlaybookStep(
+        name="dismiss_consent",
+        action="evaluate",
+        params={"script": CONSENT_CALL},
+    ),
+    PlaybookStep(
+        name="wait_results",
+        action="wait_for_selector",
+        params={"selector": GSEARCH_RESULTS, "timeout": 15000},
+    ),
+)
+
+# Distinct outbound result links in page order; %d is the number of results to keep
+_COLLECT_RESULTS_SCRIPT = (
+    "[...new Set(Array.from("
+    "document.querySelectorAll(\"#search a[href^='http']:not([href*='.google.'])\"), a => a.href))]"
+    ".slice(0, %d)"
+)
+
+_RESEARCH_META = MappingProxyType(
+    {
+        "description": "Open multiple search results and capture screenshots",
+        "init_scripts": (CONSENT_INIT_SCRIPT,),
+    }
+)
+
+
+@lru_cache(maxsize=256)
 def build_research_playbook(query: str, result_count: int = 3) -> Playbook:
-    steps = [
-        PlaybookStep(
-            name="goto_google",
-            action="navigate",
-            params={"url": "https://www.google.com"},
-            wait_for="textarea[name='q']",
-        ),
-        PlaybookStep(
-            name="focus_search",
-            action="click",
-            params={"selector": "textarea[name='q']"},
-        ),
-        PlaybookStep(
-            name="type_query",
-            action="fill",
-            params={"selector": "textarea[name='q']", "text": query},
-        ),
+    # Collect the result links in one evaluate, then capture them concurrently, each in its
+    # own tab: no clicks on the SERP and no history.back() round trips that re-render it
+    steps = (
+        *instantiate_steps(_SEARCH_STEPS, "__QUERY__", quote_query(query)),
         PlaybookStep(
-            name="submit",
+            name="collect_results",
             action="evaluate",
-            params={"script": "document.querySelector('textarea[name=\\\"q\\\"]').form.submit();"},
-        ),
-        PlaybookStep(
-            name="wait_results",
-            action="wait_for_selector",
-            params={"selector": "#search", "timeout": 15000},
+            params={"script": _COLLECT_RESULTS_SCRIPT % result_count},
         ),
-    ]
-
-    for idx in range(result_count):
-        steps.append(
-            PlaybookStep(
-                name=f"open_result_{idx+1}",
-                action="click",
-                params={"selector": f"#search a:nth-of-type({idx+1})"},
-                wait_for="body",
-            )
-        )
-        steps.append(
-            PlaybookStep(
-                name=f"capture_result_{idx+1}",
-                action="screenshot",
-                params={"path": f"/tmp/research_result_{idx+1}.png", "full_page": True},
-            )
-        )
-        steps.append(
+        *(
             PlaybookStep(
-                name=f"back_{idx+1}",
-                action="evaluate",
-                params={"script": "window.history.back();"},
-                wait_for="#search",
+                name=("capture_result", idx),
+                action="capture_page",
+                params={
+                    "url": f"{{{{steps.collect_results[{idx - 1}]}}}}",
+                    "path": f"/tmp/research_result_{idx}.png",
+                    "full_page": True,
+                },
+                parallel_group="research_results",
             )
-        )
+            for idx in range(1, result_count + 1)
+        ),
+    )
 
     return Playbook(
         name=f"research:{query}",
-        metadata={"description": "Open multiple search results and capture screenshots"},
+        metadata=_RESEARCH_META,
         steps=steps,
     )
@@ -0,0 +1,23 @@
+"""Shared CSS selectors for the Google playbooks and the UI planner."""
+from __future__ import annotations
+
+import sys
+
+# Interned so every playbook step (and any selector-keyed cache) holds the same object
+
+# Google Search
+GSEARCH_BOX = sys.intern("textarea[name='q']")
+GSEARCH_RESULTS = sys.intern("#search")
+GSEARCH_RESULT_LINK = sys.intern("#search a")
+
+# Gmail / Drive / Calendar
+GMAIN = sys.intern("div[role='main']")
+GMAIN_ROW = sys.intern("div[role='main'] tr")
+GROW_CHECKBOX = sys.intern("div[role='row'] div[role='checkbox']")
+GCOMPOSE = sys.intern("div[gh='cm']")
+GREPLY = sys.intern("div[aria-label='Reply']")
+GDRIVE_SEARCH_BOX = sys.intern("input[aria-label='Search in Drive']")
+
+# Templates for selectors that embed a name; fill with .format()
+GLABEL_FMT = "a[title='{}']"
+GBUTTON_FMT = "div[aria-label='{}']"
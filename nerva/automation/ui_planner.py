@@ -3,7 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+import random
+import re
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import (
     Any,
     Awaitable,
@@ -12,20 +15,104 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     TYPE_CHECKING,
 )
 
 from nerva.tools.browser_automation import BrowserAutomation
 
+from .selectors import GMAIN, GSEARCH_BOX, GSEARCH_RESULTS
+
 if TYPE_CHECKING:  # pragma: no cover - type hints only
     from nerva.agents.vision_action_agent import BrowserAction
 
 
 logger = logging.getLogger(__name__)
 
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "button",
+        "link",
+        "input",
+        "field",
+        "box",
+        "element",
+    }
+)
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_BUTTON_WORDS = frozenset({"button"})
+_LINK_WORDS = frozenset({"link"})
+_INPUT_WORDS = frozenset({"field", "input", "search"})
+
+
+@lru_cache(maxsize=512)
+def _extract_keywords(description: str) -> Tuple[str, ...]:
+    keywords: List[str] = []
+    for word in _TOKEN_RE.findall(description.lower()):
+        if word not in _STOP_WORDS:
+            keywords.append(word)
+            if len(keywords) == 3:
+                break
+    return tuple(keywords)
 
-@dataclass
+
+# Retries and recurring actions ask for the same targets, so selector lists are cached
+# per description; tuples keep the cached values immutable.
+@lru_cache(maxsize=512)
+def _derive_selectors(description: str) -> Tuple[str, ...]:
+    if not description:
+        return ()
+
+    tokens = set(_TOKEN_RE.findall(description.lower()))
+    selectors: List[str] = []
+
+    # Whole-word matches ("subutton" is not a button), via set intersection on one tokenization
+    if tokens & _BUTTON_WORDS:
+        for kw in _extract_keywords(description):
+            selectors.extend(
+                [
+                    f"button:has-text('{kw}')",
+                    f"a:has-text('{kw}')",
+                    f"input[type='submit']:has-text('{kw}')",
+                ]
+            )
+    elif tokens & _LINK_WORDS:
+        for kw in _extract_keywords(description):
+            selectors.append(f"a:has-text('{kw}')")
+    elif tokens & _INPUT_WORDS:
+        selectors.extend(
+            [
+                "input[type='search']",
+                GSEARCH_BOX,
+            ]
+        )
+
+    if not selectors:
+        for kw in _extract_keywords(description):
+            selectors.extend(
+                [
+                    f"text={kw}",
+                    f"*:has-text('{kw}')",
+                ]
+            )
+
+    return tuple(selectors)
+
+
+@dataclass(slots=True)
 class UIStateExpectation:
     """Guard/validation requirement for a selector."""
 
@@ -36,7 +123,7 @@ class UIStateExpectation:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UIPlan:
     """Plan describing guards, action, and validations."""
 
@@ -47,6 +134,14 @@ class UIPlan:
     max_retries: int = 2
 
 
+_EXPECTATION_FIELDS = tuple(f.name for f in fields(UIStateExpectation))
+
+
+def _expectation_dict(exp: UIStateExpectation) -> Dict[str, Any]:
+    """Plain-dict view of a slotted UIStateExpectation (no __dict__ to borrow)."""
+    return {name: getattr(exp, name) for name in _EXPECTATION_FIELDS}
+
+
 class UIPlannerError(RuntimeError):
     """Raised when planner retries are exhausted."""
 
@@ -67,17 +162,43 @@ class UIPlanner:
     """
 
     _RESULT_PATTERNS: Tuple[Tuple[Tuple[str, ...], str, int, str], ...] = (
-        (("search", "lookup", "phone", "google"), "#search", 60000, "Google results loaded"),
-        (("gmail", "inbox", "email"), "div[role='main']", 45000, "Gmail inbox ready"),
+        (("search", "lookup", "phone", "google"), GSEARCH_RESULTS, 60000, "Google results loaded"),
+        (("gmail", "inbox", "email"), GMAIN, 45000, "Gmail inbox ready"),
         (("calendar", "meeting"), "div[role='grid']", 45000, "Calendar grid visible"),
         (("drive", "file"), "div[data-target='doclist']", 45000, "Drive file list ready"),
     )
+    # One precompiled alternation per pattern: a single C-level scan instead of N substring checks
+    _COMPILED_PATTERNS: Tuple[Tuple["re.Pattern[str]", str, int, str], ...] = tuple(
+        (re.compile("|".join(map(re.escape, keywords))), selector, timeout, description)
+        for keywords, selector, timeout, description in _RESULT_PATTERNS
+    )
 
     _STAGE_STRATEGIES: Dict[str, Sequence[str]] = {
         "guard": ("scroll", "wait_short", "reload"),
         "post": ("wait_long", "scroll", "reload"),
     }
 
+    # Strategies most likely to fix each failure class; tried first when the stage allows them
+    _CLASS_STRATEGIES: Dict[str, Sequence[str]] = {
+        "slow_load": ("wait_long", "wait_short"),
+        "off_screen": ("scroll",),
+        "stale": ("reload",),
+    }
+    _SLOW_LOAD_MARKERS: Tuple[str, ...] = ("grid", "main", "doclist", "#search")
+    _OFF_SCREEN_MARKERS: Tuple[str, ...] = ("button", "input", "textarea", "has-text", "text=", "a[")
+
+    # Timeout (ms) for re-probing a selector already known to be missing
+    _MISSING_PROBE_TIMEOUT = 100
+
+    # Jittered exponential pause between attempts (seconds), bounded by a per-run budget
+    _RETRY_BASE_DELAY = 0.25
+    _RETRY_MAX_DELAY = 4.0
+    _RETRY_JITTER = 0.1
+    _RETRY_BUDGET = 8.0
+
+    # Upper bound in seconds for the wait strategies; they return as soon as the selector is ready
+    _WAIT_BUDGETS: Dict[str, float] = {"wait_short": 1.0, "wait_long": 2.5}
+
     def __init__(
         self,
         browser: BrowserAutomation,
@@ -95,28 +216,40 @@ class UIPlanner:
             raise RuntimeError("UIPlanner requires an executor callback")
 
         plan = self._build_plan(action)
+        # Expectations are fixed for the whole run; snapshot them once, outside the retry loop
+        pre_dicts = [_expectation_dict(exp) for exp in plan.preconditions]
+        post_dicts = [_expectation_dict(exp) for exp in plan.postconditions]
         summary: Dict[str, Any] = {
             "action": action.action_type,
             "target": action.target,
             "attempts": [],
-            "preconditions": [exp.__dict__ for exp in plan.preconditions],
-            "postconditions": [exp.__dict__ for exp in plan.postconditions],
+            "preconditions": pre_dicts,
+            "postconditions": post_dicts,
         }
 
+        # (selector, state) pairs that timed out; re-probed briefly until scroll/reload changes the DOM
+        missing: Set[Tuple[str, str]] = set()
+        backoff_spent = 0.0
+
         attempt = 0
         while attempt <= plan.max_retries:
             attempt += 1
             attempt_log: Dict[str, Any] = {"attempt": attempt}
 
             guards_ok, failing_guard = await self._verify_expectations(
-                plan.preconditions, attempt_log, "preconditions"
+                plan.preconditions, attempt_log, "preconditions", missing
             )
             if not guards_ok:
                 attempt_log["status"] = "guard_failed"
-                recovered = await self._attempt_recovery("guard", failing_guard, attempt_log)
+                recovered = await self._attempt_recovery("guard", failing_guard, attempt_log, missing)
                 summary["attempts"].append(attempt_log)
                 if recovered:
-                    continue
+                    backoff_spent = await self._retry_pause(attempt, attempt_log, backoff_spent)
+                    if backoff_spent is not None:
+                        continue
+                    reason = "Retry budget exhausted"
+                    summary.update({"status": "failed", "reason": reason})
+                    raise UIPlannerError(summary, reason)
                 reason = f"Target not reachable ({failing_guard.selector if failing_guard else 'unknown'})"
                 summary.update({"status": "failed", "reason": reason})
                 raise UIPlannerError(summary, reason)
@@ -128,9 +261,11 @@ class UIPlanner:
                 summary["attempts"].append(attempt_log)
                 summary.update({"status": "failed", "reason": "executor raised"})
                 raise
+            # The action changed the DOM, so earlier misses deserve a full wait again
+            missing.clear()
 
             validations_ok, failing_validation = await self._verify_expectations(
-                plan.postconditions, attempt_log, "postconditions"
+                plan.postconditions, attempt_log, "postconditions", missing
             )
             if validations_ok:
                 attempt_log["status"] = "ok"
@@ -140,10 +275,15 @@ class UIPlanner:
                 return summary
 
             attempt_log["status"] = "postcondition_failed"
-            recovered = await self._attempt_recovery("post", failing_validation, attempt_log)
+            recovered = await self._attempt_recovery("post", failing_validation, attempt_log, missing)
             summary["attempts"].append(attempt_log)
             if recovered:
-                continue
+                backoff_spent = await self._retry_pause(attempt, attempt_log, backoff_spent)
+                if backoff_spent is not None:
+                    continue
+                reason = "Retry budget exhausted"
+                summary.update({"status": "failed", "reason": reason})
+                raise UIPlannerError(summary, reason)
 
             reason = (
                 f"Postcondition not met ({failing_validation.selector if failing_validation else 'unknown'})"
@@ -187,47 +327,81 @@ class UIPlanner:
         expectations: Sequence[UIStateExpectation],
         attempt_log: Dict[str, Any],
         key: str,
+        missing: Optional[Set[Tuple[str, str]]] = None,
     ) -> Tuple[bool, Optional[UIStateExpectation]]:
-        """Check guards or validations."""
+        """Check guards or validations concurrently; the first failure cancels the rest."""
+        if not expectations:
+            attempt_log[key] = []
+            return True, None
+
+        tasks = [
+            asyncio.ensure_future(self._cached_wait(exp.selector, exp.timeout, exp.state, missing))
+            for exp in expectations
+        ]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.exception() or not task.result() for task in done):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
         results: List[Dict[str, Any]] = []
-        for exp in expectations:
-            ok = await self.browser.wait_for_selector(exp.selector, timeout=exp.timeout, state=exp.state)
+        failing: Optional[UIStateExpectation] = None
+        for exp, task in zip(expectations, tasks):
+            if task in pending:
+                status = "skipped"
+            elif task.exception() or not task.result():
+                status = "missing"
+                if failing is None:
+                    failing = exp
+            else:
+                status = "ok"
             results.append(
                 {
                     "label": exp.label,
                     "selector": exp.selector,
                     "state": exp.state,
                     "timeout": exp.timeout,
-                    "status": "ok" if ok else "missing",
+                    "status": status,
                 }
             )
-            if not ok:
-                attempt_log[key] = results
-                return False, exp
 
         attempt_log[key] = results
-        return True, None
+        return failing is None, failing
 
     async def _attempt_recovery(
         self,
         stage: str,
         failing: Optional[UIStateExpectation],
         attempt_log: Dict[str, Any],
+        missing: Optional[Set[Tuple[str, str]]] = None,
     ) -> bool:
         """Run recovery strategies for the given stage."""
         strategies = self._STAGE_STRATEGIES.get(stage, ())
         if not strategies or not self.browser.page:
             return False
+        failure_class = self._classify(stage, failing)
+        if failure_class:
+            preferred = [s for s in self._CLASS_STRATEGIES[failure_class] if s in strategies]
+            strategies = (*preferred, *(s for s in strategies if s not in preferred))
+            attempt_log["failure_class"] = failure_class
 
         recoveries: List[Dict[str, Any]] = []
         for strategy in strategies:
-            success = await self._execute_recovery_strategy(strategy)
+            success = await self._execute_recovery_strategy(strategy, failing)
             record: Dict[str, Any] = {"strategy": strategy, "status": "ok" if success else "skipped"}
+            if success and strategy in ("scroll", "reload") and missing:
+                # The DOM moved, so earlier misses deserve a full wait again
+                missing.clear()
             if success and failing:
-                ok = await self.browser.wait_for_selector(
+                ok = await self._cached_wait(
                     failing.selector,
-                    timeout=min(failing.timeout, 8000),
-                    state=failing.state,
+                    min(failing.timeout, 8000),
+                    failing.state,
+                    missing,
                 )
                 record["recheck"] = ok
                 if ok:
@@ -239,7 +413,60 @@ class UIPlanner:
         attempt_log["recovery"] = recoveries
         return False
 
-    async def _execute_recovery_strategy(self, strategy: str) -> bool:
+    async def _retry_pause(self, attempt: int, attempt_log: Dict[str, Any], spent: float) -> Optional[float]:
+        """Back off before the next attempt; returns the new total, or None when over budget."""
+        delay = min(self._RETRY_BASE_DELAY * 2 ** (attempt - 1), self._RETRY_MAX_DELAY)
+        delay += random.uniform(0, self._RETRY_JITTER)
+        backoff: Dict[str, Any] = {"strategy": "exponential_jitter", "delay": round(delay, 3)}
+        attempt_log["backoff"] = backoff
+        if spent + delay > self._RETRY_BUDGET:
+            backoff["budget_exhausted"] = True
+            return None
+        await asyncio.sleep(delay)
+        return spent + delay
+
+    async def _cached_wait(
+        self,
+        selector: str,
+        timeout: int,
+        state: str,
+        missing: Optional[Set[Tuple[str, str]]] = None,
+    ) -> bool:
+        """
+        wait_for_selector, cut to a short probe when the same selector/state already timed
+        out with no action or DOM-changing recovery since.
+        """
+        key = (selector, state)
+        if missing is not None and key in missing:
+            timeout = min(timeout, self._MISSING_PROBE_TIMEOUT)
+        ok = await self.browser.wait_for_selector(selector, timeout=timeout, state=state)
+        if ok:
+            if missing is not None:
+                missing.discard(key)
+        elif missing is not None:
+            missing.add(key)
+        return ok
+
+    @classmethod
+    def _classify(cls, stage: str, failing: Optional[UIStateExpectation]) -> Optional[str]:
+        """Map a failed expectation to off_screen / slow_load / stale so recovery starts with the likely fix."""
+        if failing is None:
+            return None
+        selector = failing.selector.lower()
+        if any(marker in selector for marker in cls._SLOW_LOAD_MARKERS):
+            return "slow_load"
+        if any(marker in selector for marker in cls._OFF_SCREEN_MARKERS):
+            return "off_screen"
+        if stage == "post":
+            # The action ran but the page never reached the expected state
+            return "stale"
+        return None
+
+    async def _execute_recovery_strategy(
+        self,
+        strategy: str,
+        failing: Optional[UIStateExpectation] = None,
+    ) -> bool:
         """Perform a single recovery routine."""
         page = self.browser.page
         if not page:
@@ -248,11 +475,12 @@ class UIPlanner:
         if strategy == "scroll":
             await page.mouse.wheel(0, 500)
             return True
-        if strategy == "wait_short":
-            await asyncio.sleep(1.0)
-            return True
-        if strategy == "wait_long":
-            await asyncio.sleep(2.5)
+        if strategy in self._WAIT_BUDGETS:
+            budget = self._WAIT_BUDGETS[strategy]
+            if failing is None:
+                await asyncio.sleep(budget)
+                return True
+            await self._wait_with_backoff(failing, budget)
             return True
         if strategy == "reload":
             await page.reload()
@@ -261,73 +489,35 @@ class UIPlanner:
         logger.debug("Unknown recovery strategy: %s", strategy)
         return False
 
-    def _selector_candidates(self, description: str) -> List[str]:
+    async def _wait_with_backoff(self, expectation: UIStateExpectation, budget: float) -> bool:
+        """Poll for the expectation in growing slices (250ms, 500ms, 1s) until it holds or budget runs out."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget
+        slice_ms = 250
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            timeout = min(slice_ms, int(remaining * 1000)) or 1
+            if await self.browser.wait_for_selector(expectation.selector, timeout=timeout, state=expectation.state):
+                return True
+            slice_ms = min(slice_ms * 2, 1000)
+
+    @staticmethod
+    def _selector_candidates(description: str) -> Tuple[str, ...]:
         """Heuristically derive selectors from a natural language description."""
-        if not description:
-            return []
-
-        desc_lower = description.lower()
-        selectors: List[str] = []
-
-        if "button" in desc_lower:
-            for kw in self._extract_keywords(description):
-                selectors.extend(
-                    [
-                        f"button:has-text('{kw}')",
-                        f"a:has-text('{kw}')",
-                        f"input[type='submit']:has-text('{kw}')",
-                    ]
-                )
-        elif "link" in desc_lower:
-            for kw in self._extract_keywords(description):
-                selectors.append(f"a:has-text('{kw}')")
-        elif any(word in desc_lower for word in ("field", "input", "search")):
-            selectors.extend(
-                [
-                    "input[type='search']",
-                    "textarea[name='q']",
-                ]
-            )
+        return _derive_selectors(description)
 
-        if not selectors:
-            for kw in self._extract_keywords(description):
-                selectors.extend(
-                    [
-                        f"text={kw}",
-                        f"*:has-text('{kw}')",
-                    ]
-                )
-
-        return selectors
-
-    def _extract_keywords(self, description: str) -> List[str]:
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "button",
-            "link",
-            "input",
-            "field",
-            "box",
-            "element",
-        }
-        words = description.lower().split()
-        return [w.strip(".,!?\"'") for w in words if w and w not in stop_words][:3]
+    @staticmethod
+    def _extract_keywords(description: str) -> Tuple[str, ...]:
+        return _extract_keywords(description)
 
     def _predict_postconditions(self, action: "BrowserAction") -> List[UIStateExpectation]:
         """Guess which selectors should appear after the action."""
         haystack = f"{action.target} {action.value or ''}".lower()
         expectations: List[UIStateExpectation] = []
-        for keywords, selector, timeout, description in self._RESULT_PATTERNS:
-            if any(keyword in haystack for keyword in keywords):
+        for pattern, selector, timeout, description in self._COMPILED_PATTERNS:
+            if pattern.search(haystack):
                 expectations.append(
                     UIStateExpectation(
                         label=selector,
@@ -1,6 +1,8 @@
 # nerva/bus.py
 from __future__ import annotations
-from typing import Callable, Dict, List
+from collections import deque
+from itertools import islice
+from typing import Callable, Deque, Dict, List, Tuple
 import logging
 from .types import Event, EventType
 
@@ -15,35 +17,37 @@ class EventBus:
     """
 
     def __init__(self) -> None:
-        self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = {}
-        self._event_history: List[Event] = []
+        # Copy-on-write tuples: publish iterates them without copying, and a handler that
+        # (un)subscribes mid-dispatch swaps in a new tuple instead of mutating the one in use
+        self._subscribers: Dict[EventType, Tuple[Callable[[Event], None], ...]] = {}
         self._max_history = 1000
+        # Bounded: appending past the cap evicts the oldest event in O(1)
+        self._event_history: Deque[Event] = deque(maxlen=self._max_history)
 
     def subscribe(self, event_type: EventType, handler: Callable[[Event], None]) -> None:
         """Register a handler for a specific event type."""
-        self._subscribers.setdefault(event_type, []).append(handler)
-        logger.debug(f"Subscribed handler to {event_type.name}")
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (handler,)
+        logger.debug("Subscribed handler to %s", event_type.name)
 
     def unsubscribe(self, event_type: EventType, handler: Callable[[Event], None]) -> None:
         """Remove a handler from an event type."""
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(handler)
-                logger.debug(f"Unsubscribed handler from {event_type.name}")
-            except ValueError:
-                pass
+        handlers = self._subscribers.get(event_type, ())
+        if handler in handlers:
+            index = handlers.index(handler)
+            self._subscribers[event_type] = handlers[:index] + handlers[index + 1:]
+            logger.debug("Unsubscribed handler from %s", event_type.name)
 
     def publish(self, event: Event) -> None:
         """Publish an event to all registered handlers."""
-        logger.info(f"Publishing event: {event.type.name} (id={event.id[:8]}...)")
+        # Lazy %-formatting: no string is built when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Publishing event: %s (id=%s...)", event.type.name, event.id[:8])
 
         # Store in history
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
 
         # Dispatch to handlers
-        handlers = self._subscribers.get(event.type, [])
+        handlers = self._subscribers.get(event.type, ())
         for handler in handlers:
             try:
                 handler(event)
@@ -52,4 +56,5 @@ class EventBus:
 
     def get_history(self, limit: int = 100) -> List[Event]:
         """Retrieve recent event history."""
-        return self._event_history[-limit:]
+        history = self._event_history
+        return list(islice(history, max(0, len(history) - limit), None))
@@ -4,12 +4,17 @@ from pathlib import Path
 import os
 
 
+_HOME = Path.home()
+_NERVA_HOME = _HOME / ".nerva"
+_TRUE_FLAGS = frozenset({"1", "true", "yes", "on"})
+
+
 def _env_flag(name: str, default: bool) -> bool:
     """Return True/False based on environment variable presence."""
     value = os.getenv(name)
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _TRUE_FLAGS
 
 
 def _env_int(name: str, default: int) -> int:
@@ -42,9 +47,9 @@ class NervaConfig:
     vision_timeout: int = field(default_factory=lambda: _env_int("VISION_TIMEOUT", 300))  # 5 min for slow vision models
 
     # Paths
-    repos_root: Path = Path.home() / "projects"
-    memory_db_path: Path = Path.home() / ".nerva" / "memory.db"
-    logs_path: Path = Path.home() / ".nerva" / "logs"
+    repos_root: Path = _HOME / "projects"
+    memory_db_path: Path = _NERVA_HOME / "memory.db"
+    logs_path: Path = _NERVA_HOME / "logs"
 
     # Voice settings
     whisper_model: str = field(default_factory=lambda: os.getenv("WHISPER_MODEL", "medium"))
@@ -56,7 +61,14 @@ class NervaConfig:
     # Daily ops
     daily_ops_hour: int = field(default_factory=lambda: _env_int("DAILY_OPS_HOUR", 9))
 
+    # Create the memory/log directories on init (disable for configs that never touch disk)
+    ensure_dirs: bool = True
+
     def __post_init__(self) -> None:
         """Ensure required directories exist."""
-        self.memory_db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.logs_path.mkdir(parents=True, exist_ok=True)
+        if not self.ensure_dirs:
+            return
+        # A stat is cheaper than mkdir, and the directories exist after the first run
+        for directory in (self.memory_db_path.parent, self.logs_path):
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
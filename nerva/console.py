@@ -13,8 +13,10 @@ A full-featured terminal UI that provides tabs for each NERVA mode:
 from __future__ import annotations
 
 import asyncio
+import os
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import logging
 
 from textual.app import App, ComposeResult
@@ -34,6 +36,7 @@ from textual.reactive import reactive
 from .config import NervaConfig
 from .llm.factory import create_llm_client
 from .memory.store import MemoryStore
+from .repos.repo_index import warm_repo_tree
 from .workflows import (
     build_screen_dag,
     build_voice_dag,
@@ -45,6 +48,9 @@ from .run_context import RunContext
 
 logger = logging.getLogger(__name__)
 
+# Memory browser color per MemoryType name
+MEMORY_TYPE_COLORS = {"Q_AND_A": "cyan", "DAILY_OP": "green", "REPO_INSIGHT": "yellow"}
+
 
 class StatusBar(Static):
     """Status bar widget showing current operation status."""
@@ -113,6 +119,14 @@ class NervaConsole(App):
         ("ctrl+c", "quit", "Quit"),
     ]
 
+    # Run button for each DAG, disabled while that DAG is running
+    _DAG_BUTTONS = {
+        "screen": "btn-screen-run",
+        "voice": "btn-voice-run",
+        "daily": "btn-daily-run",
+        "repo": "btn-repo-run",
+    }
+
     def __init__(self, use_mock_llm: bool = False) -> None:
         super().__init__()
         self.cfg = NervaConfig()
@@ -132,6 +146,12 @@ class NervaConsole(App):
 
         self.memory = MemoryStore()
 
+        # DAGs are built once per console (same LLM and memory) and reused by every run
+        self._screen_dag = build_screen_dag(llm=self.llm, memory=self.memory)
+        self._voice_dag = build_voice_dag(llm=self.llm, memory=self.memory)
+        self._daily_ops_dag = build_daily_ops_dag(llm=self.llm, memory=self.memory)
+        self._repo_dag = build_repo_dag(llm=self.llm, memory=self.memory)
+
         # Widget handles
         self.event_log: Optional[RichLog] = None
         self.status_bar: Optional[StatusBar] = None
@@ -152,6 +172,13 @@ class NervaConsole(App):
 
         self.nodes_output: Optional[RichLog] = None
 
+        # One lock per DAG: a second click (or Enter + click) while it runs is ignored
+        self._dag_locks = {name: asyncio.Lock() for name in self._DAG_BUTTONS}
+
+        # Event log (template, kwargs) pairs buffered until the next refresh, then
+        # formatted and written in one call
+        self._pending_log: List[Tuple[str, Dict[str, Any]]] = []
+
     # ========================================================================
     # Layout
     # ========================================================================
@@ -261,6 +288,18 @@ class NervaConsole(App):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Warm the filesystem cache for the default repo root in a background thread."""
+        self.run_worker(self._warm_repo_cache, thread=True, exclusive=True, group="repo-warm")
+
+    def _warm_repo_cache(self) -> None:
+        # A bounded, read-free walk pulls directory entries and inodes into the OS cache,
+        # so the first Repo question does not pay the cold-disk cost
+        try:
+            warm_repo_tree(Path.cwd())
+        except Exception as e:  # pragma: no cover - best effort
+            logger.debug(f"Repo cache warm-up failed: {e}")
+
     # ========================================================================
     # Actions for keybindings
     # ========================================================================
@@ -298,10 +337,25 @@ class NervaConsole(App):
     # Helpers
     # ========================================================================
 
-    def log_msg(self, msg: str) -> None:
-        """Write a message to the event log."""
-        if self.event_log is not None:
-            self.event_log.write(msg)
+    def log_msg(self, msg: str, **kw: Any) -> None:
+        """
+        Queue a message for the event log; queued lines are flushed together after the next refresh.
+
+        With keyword arguments, msg is a str.format template filled in only when flushed, so
+        nothing is formatted while the event log is not mounted.
+        """
+        if self.event_log is None:
+            return
+        if not self._pending_log:
+            self.call_after_refresh(self._flush_log)
+        self._pending_log.append((msg, kw))
+
+    def _flush_log(self) -> None:
+        if self.event_log is not None and self._pending_log:
+            self.event_log.write(
+                "\n".join(msg.format(**kw) if kw else msg for msg, kw in self._pending_log)
+            )
+        self._pending_log.clear()
 
     def set_status(self, msg: str) -> None:
         """Update the status bar."""
@@ -316,13 +370,13 @@ class NervaConsole(App):
         """Handle all button presses."""
         button_id = event.button.id
         if button_id == "btn-screen-run":
-            await self.run_screen_dag()
+            self._run_exclusive("screen", self.run_screen_dag)
         elif button_id == "btn-voice-run":
-            await self.run_voice_dag()
+            self._run_exclusive("voice", self.run_voice_dag)
         elif button_id == "btn-daily-run":
-            await self.run_daily_ops_dag()
+            self._run_exclusive("daily", self.run_daily_ops_dag)
         elif button_id == "btn-repo-run":
-            await self.run_repo_dag()
+            self._run_exclusive("repo", self.run_repo_dag)
         elif button_id == "btn-memory-refresh":
             await self.refresh_memory_view()
         elif button_id == "btn-nodes-refresh":
@@ -332,9 +386,30 @@ class NervaConsole(App):
         """Handle Enter key in input fields."""
         input_id = event.input.id
         if input_id == "voice-input":
-            await self.run_voice_dag()
+            self._run_exclusive("voice", self.run_voice_dag)
         elif input_id == "repo-question-input":
-            await self.run_repo_dag()
+            self._run_exclusive("repo", self.run_repo_dag)
+
+    def _run_exclusive(self, name: str, runner: Callable[[], Awaitable[None]]) -> None:
+        """
+        Start a DAG runner as a worker so the app keeps handling input and repainting while
+        it awaits slow nodes; the runner is skipped if that DAG is already running.
+        """
+        self.run_worker(self._run_locked(name, runner), name=f"dag-{name}", group="dag")
+
+    async def _run_locked(self, name: str, runner: Callable[[], Awaitable[None]]) -> None:
+        """Run a DAG runner unless that DAG is already running; its button is disabled meanwhile."""
+        lock = self._dag_locks[name]
+        if lock.locked():
+            self.set_status(f"{name.capitalize()} DAG already running")
+            return
+        async with lock:
+            button = self.query_one(f"#{self._DAG_BUTTONS[name]}", Button)
+            button.disabled = True
+            try:
+                await runner()
+            finally:
+                button.disabled = False
 
     # ========================================================================
     # DAG Runners
@@ -368,14 +443,14 @@ class NervaConsole(App):
             return
 
         self.set_status("Running Voice DAG...")
-        self.log_msg(f"[cyan][voice][/cyan] Input: {text[:50]}...")
+        self.log_msg("[cyan][voice][/cyan] Input: {text:.50}...", text=text)
 
         if self.voice_output is not None:
             self.voice_output.clear()
             self.voice_output.write("[dim]Processing...[/dim]")
 
         ctx = RunContext(mode="voice", voice_text=text)
-        dag = build_voice_dag(llm=self.llm, memory=self.memory)
+        dag = self._voice_dag
 
         try:
             ctx = await dag.run(ctx)
@@ -390,12 +465,19 @@ class NervaConsole(App):
 
         if self.voice_output is not None:
             self.voice_output.clear()
-            self.voice_output.write(f"[bold]Intent:[/bold] {ctx.intent}\n\n")
-            self.voice_output.write("[bold]Response:[/bold]\n")
-            self.voice_output.write(ctx.llm_raw_response or "[dim]No response[/dim]")
+            self.voice_output.write(
+                "\n".join(
+                    [
+                        f"[bold]Intent:[/bold] {ctx.intent}",
+                        "",
+                        "[bold]Response:[/bold]",
+                        ctx.llm_raw_response or "[dim]No response[/dim]",
+                    ]
+                )
+            )
 
         self.set_status("Voice DAG completed")
-        self.log_msg(f"[green][voice][/green] Completed (intent: {ctx.intent})")
+        self.log_msg("[green][voice][/green] Completed (intent: {intent})", intent=ctx.intent)
 
         # Clear input for next command
         if self.voice_input is not None:
@@ -411,7 +493,7 @@ class NervaConsole(App):
             self.daily_output.write("[dim]Collecting data and generating summary...[/dim]")
 
         ctx = RunContext(mode="daily_ops")
-        dag = build_daily_ops_dag(llm=self.llm, memory=self.memory)
+        dag = self._daily_ops_dag
 
         try:
             ctx = await dag.run(ctx)
@@ -426,10 +508,12 @@ class NervaConsole(App):
 
         if self.daily_output is not None:
             self.daily_output.clear()
-            self.daily_output.write("[bold green]Daily Summary[/bold green]\n")
-            self.daily_output.write(ctx.daily_summary or "[dim]No summary generated[/dim]")
-            self.daily_output.write("\n\n[bold cyan]Tasks[/bold cyan]\n")
-
+            task_lines: List[str] = [
+                "[bold green]Daily Summary[/bold green]",
+                ctx.daily_summary or "[dim]No summary generated[/dim]",
+                "",
+                "[bold cyan]Tasks[/bold cyan]",
+            ]
             for i, task in enumerate(ctx.daily_tasks, 1):
                 priority = task.get("priority", "medium")
                 title = task.get("title", "Untitled")
@@ -443,12 +527,13 @@ class NervaConsole(App):
                 else:
                     color = "green"
 
-                self.daily_output.write(f"{i}. [{color}]■[/{color}] {title}")
+                task_lines.append(f"{i}. [{color}]■[/{color}] {title}")
                 if reason:
-                    self.daily_output.write(f"   [dim]→ {reason}[/dim]")
+                    task_lines.append(f"   [dim]→ {reason}[/dim]")
+            self.daily_output.write("\n".join(task_lines))
 
         self.set_status("Daily Ops DAG completed")
-        self.log_msg(f"[green][daily_ops][/green] Completed ({len(ctx.daily_tasks)} tasks)")
+        self.log_msg("[green][daily_ops][/green] Completed ({count} tasks)", count=len(ctx.daily_tasks))
 
     async def run_repo_dag(self) -> None:
         """Run repo-aware assistant workflow."""
@@ -456,6 +541,7 @@ class NervaConsole(App):
             return
 
         repo_root = self.repo_root_input.value.strip() or str(Path.cwd())
+        repo_root = await asyncio.to_thread(os.path.realpath, repo_root)
         question = self.repo_question_input.value.strip()
 
         if not question:
@@ -463,15 +549,15 @@ class NervaConsole(App):
             return
 
         self.set_status("Running Repo DAG...")
-        self.log_msg(f"[cyan][repo][/cyan] Root: {repo_root}")
-        self.log_msg(f"[cyan][repo][/cyan] Question: {question[:50]}...")
+        self.log_msg("[cyan][repo][/cyan] Root: {root}", root=repo_root)
+        self.log_msg("[cyan][repo][/cyan] Question: {question:.50}...", question=question)
 
         if self.repo_output is not None:
             self.repo_output.clear()
             self.repo_output.write("[dim]Indexing repository and generating answer...[/dim]")
 
         ctx = RunContext(mode="repo", repo_root=repo_root, repo_question=question)
-        dag = build_repo_dag(llm=self.llm, memory=self.memory)
+        dag = self._repo_dag
 
         try:
             ctx = await dag.run(ctx)
@@ -486,10 +572,17 @@ class NervaConsole(App):
 
         if self.repo_output is not None:
             self.repo_output.clear()
-            self.repo_output.write(f"[bold]Repo:[/bold] {repo_root}\n")
-            self.repo_output.write(f"[bold]Question:[/bold] {question}\n\n")
-            self.repo_output.write("[bold green]Answer:[/bold green]\n")
-            self.repo_output.write(ctx.repo_answer or "[dim]No answer generated[/dim]")
+            self.repo_output.write(
+                "\n".join(
+                    [
+                        f"[bold]Repo:[/bold] {repo_root}",
+                        f"[bold]Question:[/bold] {question}",
+                        "",
+                        "[bold green]Answer:[/bold green]",
+                        ctx.repo_answer or "[dim]No answer generated[/dim]",
+                    ]
+                )
+            )
 
         self.set_status("Repo DAG completed")
         self.log_msg("[green][repo][/green] Completed")
@@ -507,37 +600,31 @@ class NervaConsole(App):
         self.set_status("Refreshing Memory view...")
         self.log_msg("[cyan][memory][/cyan] Refreshing Memory view")
 
-        items = self.memory.all()
+        total = len(self.memory)
+        items = self.memory.recent(50)
 
         if self.memory_output is not None:
             self.memory_output.clear()
             if not items:
                 self.memory_output.write("[dim]No memory items yet. Run some workflows to populate memory.[/dim]")
             else:
-                self.memory_output.write(f"[bold]Total Items:[/bold] {len(items)}\n\n")
+                lines = [f"[bold]Total Items:[/bold] {total}\n"]
 
                 # Show most recent 50
-                for item in items[-50:]:
-                    timestamp = item.created_at.strftime("%H:%M:%S")
+                for item in items:
+                    t = item.created_at
+                    timestamp = f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
                     mem_type = item.type.name
                     text_preview = item.text[:100].replace("\n", " ")
+                    color = MEMORY_TYPE_COLORS.get(mem_type, "white")
 
-                    # Color code by type
-                    if mem_type == "Q_AND_A":
-                        color = "cyan"
-                    elif mem_type == "DAILY_OP":
-                        color = "green"
-                    elif mem_type == "REPO_INSIGHT":
-                        color = "yellow"
-                    else:
-                        color = "white"
+                    lines.append(f"[dim]{timestamp}[/dim] [{color}]{mem_type}[/{color}]: {text_preview}...")
 
-                    self.memory_output.write(
-                        f"[dim]{timestamp}[/dim] [{color}]{mem_type}[/{color}]: {text_preview}..."
-                    )
+                # One write, so the log lays out once instead of once per item
+                self.memory_output.write("\n".join(lines))
 
         self.set_status("Memory view updated")
-        self.log_msg(f"[green][memory][/green] Loaded {len(items)} items")
+        self.log_msg("[green][memory][/green] Loaded {total} items", total=total)
 
     async def refresh_nodes_view(self) -> None:
         """Refresh the nodes status view."""
@@ -546,12 +633,14 @@ class NervaConsole(App):
 
         if self.nodes_output is not None:
             self.nodes_output.clear()
-            self.nodes_output.write("[bold]SOLLOL Nodes[/bold]\n\n")
-            self.nodes_output.write("[yellow]⚠[/yellow] SOLLOL integration not yet implemented.\n\n")
-            self.nodes_output.write("To enable:\n")
-            self.nodes_output.write("1. Install SOLLOL from your local repo\n")
-            self.nodes_output.write("2. Implement collectors.collect_sollol_status()\n")
-            self.nodes_output.write("3. Wire in real node metrics here\n")
+            self.nodes_output.write(
+                "[bold]SOLLOL Nodes[/bold]\n\n"
+                "[yellow]⚠[/yellow] SOLLOL integration not yet implemented.\n\n"
+                "To enable:\n"
+                "1. Install SOLLOL from your local repo\n"
+                "2. Implement collectors.collect_sollol_status()\n"
+                "3. Wire in real node metrics here\n"
+            )
 
         self.set_status("Nodes view (stub)")
         self.log_msg("[yellow][nodes][/yellow] Nodes view not implemented")
@@ -564,6 +653,15 @@ def run(use_mock_llm: bool = False) -> None:
     Args:
         use_mock_llm: If True, use mock LLM client instead of Ollama/SOLLOL
     """
+    # DAG runners are I/O-bound (LLM/HTTP/filesystem); uvloop cuts per-coroutine overhead
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
     app = NervaConsole(use_mock_llm=use_mock_llm)
     app.run()
 
@@ -1,9 +1,10 @@
 # nerva/dag.py
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Callable, Awaitable, Set
+from typing import Any, Dict, List, Callable, Awaitable, Optional, Set
 import asyncio
 import logging
+from collections import deque
 
 from .run_context import RunContext
 
@@ -15,10 +16,17 @@ DagFunc = Callable[[RunContext], Awaitable[None]]
 
 @dataclass
 class DagNode:
-    """A single node in a DAG workflow."""
+    """
+    A single node in a DAG workflow.
+
+    Nodes whose dependencies are all satisfied run concurrently with the rest of their
+    level and share one RunContext, so nodes in the same level must write disjoint
+    context attributes. Declare them in ``writes`` to have overlaps rejected.
+    """
     name: str
     func: DagFunc
     deps: List[str] = field(default_factory=list)
+    writes: Set[str] = field(default_factory=set)
 
 
 class Dag:
@@ -31,58 +39,135 @@ class Dag:
     def __init__(self, name: str) -> None:
         self.name = name
         self._nodes: Dict[str, DagNode] = {}
+        # Topological order, computed on first run and reused until the graph changes
+        self._order: Optional[List[DagNode]] = None
+        self._levels: Optional[List[List[DagNode]]] = None
 
     def add_node(self, node: DagNode) -> None:
         """Add a node to the DAG."""
         if node.name in self._nodes:
             raise ValueError(f"Node {node.name} already exists in DAG {self.name}")
         self._nodes[node.name] = node
+        self._order = None
+        self._levels = None
         logger.debug(f"[{self.name}] Added node: {node.name} (deps={node.deps})")
 
-    def _topological_order(self) -> List[DagNode]:
+    def finalize(self) -> "Dag":
         """
-        Compute topological ordering of nodes using DFS.
-        Raises ValueError if cycle is detected.
+        Validate dependencies, writes and acyclicity, and cache the execution order.
+
+        Builders call this once the graph is complete so errors surface at construction;
+        run() finalizes lazily if the graph changed (or was never finalized).
         """
-        visited: Set[str] = set()
-        temp: Set[str] = set()
-        order: List[DagNode] = []
+        self._order = self._topological_order()
+        self._levels = self._level_order()
+        return self
 
-        def visit(name: str) -> None:
-            if name in visited:
-                return
-            if name in temp:
-                raise ValueError(f"Cycle detected in DAG {self.name}: {name}")
-            temp.add(name)
-            node = self._nodes.get(name)
-            if node is None:
-                raise ValueError(f"Missing node {name} in DAG {self.name}")
+    def _topological_order(self) -> List[DagNode]:
+        """
+        Compute topological ordering of nodes using Kahn's algorithm (iterative, no recursion).
+        Raises ValueError if a dependency is missing or a cycle is detected.
+        """
+        nodes = self._nodes
+        if not any(node.deps for node in nodes.values()):
+            # No edges: insertion order is already a valid order
+            return list(nodes.values())
+
+        in_degree: Dict[str, int] = {name: 0 for name in nodes}
+        children: Dict[str, List[str]] = {name: [] for name in nodes}
+        for node in nodes.values():
             for dep in node.deps:
-                visit(dep)
-            temp.remove(name)
-            visited.add(name)
-            order.append(node)
+                if dep not in nodes:
+                    raise ValueError(f"Missing node {dep} in DAG {self.name}")
+                in_degree[node.name] += 1
+                children[dep].append(node.name)
 
-        for name in self._nodes:
-            visit(name)
+        # Seeded in insertion order, so independent nodes keep the order they were added in
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        order: List[DagNode] = []
+        while ready:
+            name = ready.popleft()
+            order.append(nodes[name])
+            for child in children[name]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(nodes):
+            stuck = next(name for name, degree in in_degree.items() if degree > 0)
+            raise ValueError(f"Cycle detected in DAG {self.name}: {stuck}")
 
         return order
 
+    def _level_order(self) -> List[List[DagNode]]:
+        """
+        Partition the topological order into levels: each node sits one level below its
+        deepest dependency, so every node in a level can run once earlier levels finish.
+        Raises ValueError if two nodes in a level declare overlapping writes.
+        """
+        if self._order is None:
+            self._order = self._topological_order()
+
+        depth: Dict[str, int] = {}
+        levels: List[List[DagNode]] = []
+        for node in self._order:
+            level = max((depth[dep] + 1 for dep in node.deps), default=0)
+            depth[node.name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(node)
+
+        for level_nodes in levels:
+            written: Dict[str, str] = {}
+            for node in level_nodes:
+                for attr in node.writes:
+                    if attr in written:
+                        raise ValueError(
+                            f"Nodes {written[attr]} and {node.name} in DAG {self.name} "
+                            f"both write '{attr}' but may run concurrently"
+                        )
+                    written[attr] = node.name
+        return levels
+
+    async def _run_node(self, node: DagNode, ctx: RunContext, index: int, total: int) -> None:
+        logger.info(f"[{self.name}] [{index}/{total}] Running node: {node.name}")
+        try:
+            await node.func(ctx)
+        except Exception as e:
+            logger.error(f"[{self.name}] Node {node.name} failed: {e}", exc_info=True)
+            raise
+
     async def run(self, ctx: RunContext) -> RunContext:
         """
         Execute the DAG with the given context.
         Returns the mutated context after all nodes complete.
         """
         logger.info(f"[{self.name}] Starting DAG execution")
-        order = self._topological_order()
-
-        for i, node in enumerate(order):
-            logger.info(f"[{self.name}] [{i+1}/{len(order)}] Running node: {node.name}")
+        if self._levels is None:
+            self.finalize()
+        total = len(self._nodes)
+
+        index = 0
+        for level in self._levels:
+            if len(level) == 1:
+                index += 1
+                await self._run_node(level[0], ctx, index, total)
+                await asyncio.sleep(0)
+                continue
+            # Independent nodes: run the level concurrently; a failure cancels its siblings
+            tasks = [
+                asyncio.ensure_future(self._run_node(node, ctx, index + offset, total))
+                for offset, node in enumerate(level, start=1)
+            ]
+            index += len(level)
             try:
-                await node.func(ctx)
-            except Exception as e:
-                logger.error(f"[{self.name}] Node {node.name} failed: {e}", exc_info=True)
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
                 raise
+            # Yield between levels so a UI sharing the loop (the console) can repaint
+            await asyncio.sleep(0)
 
         logger.info(f"[{self.name}] DAG execution complete")
         return ctx
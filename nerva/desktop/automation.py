@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import platform
+import threading
 import time
 from typing import Optional
 
@@ -13,9 +15,42 @@ except Exception:  # pragma: no cover - optional dependency
     pyautogui = None
     PYAUTOGUI_AVAILABLE = False
 
+try:
+    import mss
+    from mss import tools as mss_tools
+
+    MSS_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    mss = None
+    mss_tools = None
+    MSS_AVAILABLE = False
+
+try:
+    import pyperclip
+
+    PYPERCLIP_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    pyperclip = None
+    PYPERCLIP_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+# Text longer than this is pasted from the clipboard instead of typed key by key
+PASTE_THRESHOLD = 32
+PASTE_SETTLE_SECONDS = 0.1
+_PASTE_KEYS = ("command", "v") if platform.system() == "Darwin" else ("ctrl", "v")
+
+# mss grabbers hold per-thread display handles, so keep one per thread
+_mss_local = threading.local()
+
+
+def _grabber():
+    sct = getattr(_mss_local, "sct", None)
+    if sct is None:
+        sct = _mss_local.sct = mss.mss()
+    return sct
+
 
 class DesktopAutomation:
     """
@@ -28,6 +63,12 @@ class DesktopAutomation:
         self.fail_silent = fail_silent
         if not PYAUTOGUI_AVAILABLE:
             logger.warning("pyautogui not installed; DesktopAutomation will no-op.")
+            # Shadow the input methods once so the available path carries no per-call check
+            for name in ("move", "click", "type_text", "hotkey"):
+                setattr(self, name, self._unavailable)
+
+    def _unavailable(self, *args, **kwargs) -> None:
+        self._ensure_available()
 
     def _ensure_available(self) -> bool:
         if not PYAUTOGUI_AVAILABLE:
@@ -37,26 +78,53 @@ class DesktopAutomation:
         return True
 
     def move(self, x: int, y: int, duration: float = 0.2) -> None:
-        if not self._ensure_available():
-            return
         pyautogui.moveTo(x, y, duration=duration)
 
     def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left") -> None:
-        if not self._ensure_available():
-            return
         pyautogui.click(x=x, y=y, button=button)
 
-    def type_text(self, text: str, interval: float = 0.05) -> None:
-        if not self._ensure_available():
-            return
+    def type_text(self, text: str, interval: float = 0.05, use_paste: bool = True) -> None:
+        if use_paste and PYPERCLIP_AVAILABLE and len(text) > PASTE_THRESHOLD:
+            # One paste instead of len(text) key events spaced by interval
+            if self._paste(text):
+                return
         pyautogui.typewrite(text, interval=interval)
 
+    def _paste(self, text: str) -> bool:
+        """Paste text via the clipboard, restoring the user's clipboard afterwards (best effort)."""
+        try:
+            saved = pyperclip.paste()
+        except Exception as e:
+            logger.debug(f"clipboard read failed, not pasting: {e}")
+            return False
+        try:
+            pyperclip.copy(text)
+            pyautogui.hotkey(*_PASTE_KEYS)
+            # Some apps read the clipboard after the keystroke is delivered; let them first
+            time.sleep(PASTE_SETTLE_SECONDS)
+            return True
+        except Exception as e:
+            logger.debug(f"clipboard paste failed, falling back to typewrite: {e}")
+            return False
+        finally:
+            try:
+                pyperclip.copy(saved)
+            except Exception as e:
+                logger.debug(f"clipboard restore failed: {e}")
+
     def hotkey(self, *keys: str) -> None:
-        if not self._ensure_available():
-            return
         pyautogui.hotkey(*keys)
 
     def screenshot(self, path: str) -> None:
+        if MSS_AVAILABLE:
+            # Grab the raw pixels and encode PNG straight to disk, skipping the PIL image copy
+            try:
+                sct = _grabber()
+                shot = sct.grab(sct.monitors[0])
+                mss_tools.to_png(shot.rgb, shot.size, output=path)
+                return
+            except Exception as e:
+                logger.debug(f"mss capture failed, falling back to pyautogui: {e}")
         if not self._ensure_available():
             return
         image = pyautogui.screenshot()
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -53,8 +53,8 @@ class KnowledgeGraph:
                 queue.append((dst, depth + 1))
         return result
 
-    def ingest_thread(self, thread_id: str, thread_title: str, entries: List[Dict[str, str]]) -> None:
-        """Create graph nodes/edges for a task thread."""
+    def ingest_thread(self, thread_id: str, thread_title: str, entries: Iterable[Dict[str, str]]) -> None:
+        """Create graph nodes/edges for a task thread (entries may be an incremental batch)."""
         thread_node = Node(node_id=thread_id, label=thread_title, type="thread")
         self.add_node(thread_node)
 
@@ -1,7 +1,8 @@
 # nerva/llm/qwen_client.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 import base64
+import json
 import logging
 import aiohttp
 
@@ -68,17 +69,14 @@ class QwenOllamaClient(BaseLLMClient):
             logger.error(f"[QwenClient] Unexpected response format: {data}")
             raise ValueError(f"Invalid response structure: {e}")
 
-    async def vision_chat(
+    def _vision_payload(
         self,
         messages: List[Dict[str, str]],
         images: List[bytes],
+        stream: bool,
         **kwargs: Any,
-    ) -> str:
-        """
-        Vision chat via Ollama's /api/generate endpoint with base64 images.
-
-        Ollama expects 'images' as an array of base64-encoded strings.
-        """
+    ) -> Dict[str, Any]:
+        """Build an Ollama /api/generate payload with base64 images."""
         # Encode images to base64
         b64_images = [base64.b64encode(img).decode("utf-8") for img in images]
 
@@ -90,14 +88,27 @@ class QwenOllamaClient(BaseLLMClient):
             prompt_parts.append(f"{role}: {content}")
         prompt = "\n".join(prompt_parts)
 
-        payload = {
+        return {
             "model": self.model,
             "prompt": prompt,
             "images": b64_images,
-            "stream": False,
+            "stream": stream,
             **kwargs,
         }
 
+    async def vision_chat(
+        self,
+        messages: List[Dict[str, str]],
+        images: List[bytes],
+        **kwargs: Any,
+    ) -> str:
+        """
+        Vision chat via Ollama's /api/generate endpoint with base64 images.
+
+        Ollama expects 'images' as an array of base64-encoded strings.
+        """
+        payload = self._vision_payload(messages, images, stream=False, **kwargs)
+
         logger.debug(f"[QwenClient] Sending vision request: {len(images)} images")
 
         async with aiohttp.ClientSession(timeout=self.timeout) as session:
@@ -119,3 +130,43 @@ class QwenOllamaClient(BaseLLMClient):
         except KeyError as e:
             logger.error(f"[QwenClient] Unexpected response format: {data}")
             raise ValueError(f"Invalid response structure: {e}")
+
+    async def vision_chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        images: List[bytes],
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of vision_chat; yields response text chunks as Ollama emits them.
+
+        Ollama streams newline-delimited JSON objects, each carrying a "response" fragment,
+        until one arrives with "done": true.
+        """
+        payload = self._vision_payload(messages, images, stream=True, **kwargs)
+
+        logger.debug(f"[QwenClient] Sending streaming vision request: {len(images)} images")
+
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            try:
+                async with session.post(
+                    f"{self.base_url}/api/generate",
+                    json=payload,
+                ) as resp:
+                    resp.raise_for_status()
+                    async for line in resp.content:
+                        if not line.strip():
+                            continue
+                        try:
+                            data = json.loads(line)
+                        except json.JSONDecodeError as e:
+                            logger.error(f"[QwenClient] Unexpected stream chunk: {line!r}")
+                            raise ValueError(f"Invalid stream chunk: {e}")
+                        chunk = data.get("response")
+                        if chunk:
+                            yield chunk
+                        if data.get("done"):
+                            break
+            except aiohttp.ClientError as e:
+                logger.error(f"[QwenClient] HTTP error: {e}")
+                raise
@@ -41,6 +41,16 @@ class MemoryStore:
         with self._lock:
             return list(self._items)
 
+    def recent(self, n: int) -> List[MemoryItem]:
+        """Retrieve the n most recently added items, oldest first."""
+        if n <= 0:
+            return []
+        with self._lock:
+            return self._items[-n:]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
     def filter_by_type(self, mem_type: MemoryType, limit: int = 100) -> List[MemoryItem]:
         """Get all items of a specific type."""
         with self._lock:
@@ -4,10 +4,17 @@ from dataclasses import dataclass
 from typing import List, Tuple
 from pathlib import Path
 import logging
+import os
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EXTS: Tuple[str, ...] = (".py", ".md", ".toml", ".yaml", ".yml", ".json", ".txt")
+DEFAULT_EXCLUDE_DIRS: Tuple[str, ...] = (
+    ".git", "__pycache__", "node_modules", "venv", ".venv",
+    "dist", "build", ".eggs", "*.egg-info",
+)
+
 
 @dataclass
 class RepoFile:
@@ -20,12 +27,9 @@ class RepoFile:
 
 def index_repo(
     root: Path,
-    exts: Tuple[str, ...] = (".py", ".md", ".toml", ".yaml", ".yml", ".json", ".txt"),
+    exts: Tuple[str, ...] = DEFAULT_EXTS,
     max_file_size: int = 1024 * 1024,  # 1MB default
-    exclude_dirs: Tuple[str, ...] = (
-        ".git", "__pycache__", "node_modules", "venv", ".venv",
-        "dist", "build", ".eggs", "*.egg-info",
-    ),
+    exclude_dirs: Tuple[str, ...] = DEFAULT_EXCLUDE_DIRS,
 ) -> List[RepoFile]:
     """
     Recursively index all relevant files in a repository.
@@ -85,6 +89,37 @@ def index_repo(
     return files
 
 
+def warm_repo_tree(
+    root: Path,
+    max_entries: int = 5000,
+    exts: Tuple[str, ...] = DEFAULT_EXTS,
+    exclude_dirs: Tuple[str, ...] = DEFAULT_EXCLUDE_DIRS,
+) -> int:
+    """
+    Walk the tree index_repo would visit and stat its candidate files, without reading them.
+
+    Pulls directory entries and inodes into the OS cache so a later index_repo() starts
+    warm. Excluded directories are pruned and the walk stops after max_entries files,
+    so it stays cheap even when started from a large directory such as $HOME.
+
+    Returns:
+        Number of files visited
+    """
+    visited = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
+        for filename in filenames:
+            if visited >= max_entries:
+                return visited
+            visited += 1
+            if os.path.splitext(filename)[1] in exts:
+                try:
+                    os.stat(os.path.join(dirpath, filename))
+                except OSError:
+                    continue
+    return visited
+
+
 def summarize_repo_structure(files: List[RepoFile], max_files: int = 50) -> str:
     """
     Create a compact summary of repository structure.
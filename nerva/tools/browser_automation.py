@@ -11,7 +11,7 @@ Provides programmatic browser control for:
 Uses Playwright for cross-browser automation.
 """
 from __future__ import annotations
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Iterable
 from pathlib import Path
 import logging
 import asyncio
@@ -29,6 +29,24 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Viewport centre of the element if it is enabled, fully inside the viewport and not covered
+# at that point; null (so the caller falls back to a normal Playwright click) otherwise, or
+# when the selector is Playwright-only syntax that querySelector rejects
+_VISIBLE_CENTER_SCRIPT = """
+(sel) => {
+    let e;
+    try { e = document.querySelector(sel); } catch (err) { return null; }
+    if (!e || e.disabled) return null;
+    const r = e.getBoundingClientRect();
+    if (r.width === 0 || r.height === 0 || r.top < 0 || r.left < 0
+        || r.bottom > innerHeight || r.right > innerWidth) return null;
+    const x = r.left + r.width / 2, y = r.top + r.height / 2;
+    const hit = document.elementFromPoint(x, y);
+    if (!hit || !(hit === e || e.contains(hit))) return null;
+    return [x, y];
+}
+""".strip()
+
 
 class BrowserAutomation:
     """
@@ -71,6 +89,9 @@ class BrowserAutomation:
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self._is_persistent = user_data_dir is not None
+        self._blocked_resource_types: frozenset = frozenset()
+        self._routed_page: Optional[Page] = None
+        self._init_scripts: List[str] = []
 
     async def start(self):
         """Start the browser and create a page."""
@@ -111,6 +132,9 @@ class BrowserAutomation:
             self.context = await self.browser.new_context()
             self.page = await self.context.new_page()
 
+        for script in self._init_scripts:
+            await self.context.add_init_script(script=script)
+
         logger.info("✅ Browser ready")
 
     async def stop(self):
@@ -123,6 +147,11 @@ class BrowserAutomation:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
+        # Cleared so `if not browser.page` checks see a stopped browser and start a new one
+        self.page = None
+        self.context = None
+        self.browser = None
+        self.playwright = None
 
         logger.info("🛑 Browser stopped")
 
@@ -150,13 +179,21 @@ class BrowserAutomation:
             "status": response.status if response else None,
         }
 
-    async def click(self, selector: str, timeout: float = 30000) -> bool:
+    async def click(
+        self,
+        selector: str,
+        timeout: float = 30000,
+        skip_scroll_if_visible: bool = False,
+    ) -> bool:
         """
         Click an element.
 
         Args:
             selector: CSS selector or text selector
             timeout: Maximum wait time in milliseconds
+            skip_scroll_if_visible: If the element is already enabled, inside the viewport and
+                   uncovered, click its centre with the (trusted) mouse and skip Playwright's
+                   scroll-into-view/actionability pass
 
         Returns:
             True if successful
@@ -166,6 +203,11 @@ class BrowserAutomation:
 
         logger.info(f"🖱️  Clicking: {selector}")
         try:
+            if skip_scroll_if_visible:
+                center = await self.page.evaluate(_VISIBLE_CENTER_SCRIPT, selector)
+                if center:
+                    await self.page.mouse.click(*center)
+                    return True
             await self.page.click(selector, timeout=timeout)
             return True
         except Exception as e:
@@ -195,6 +237,29 @@ class BrowserAutomation:
             logger.error(f"Fill failed: {e}")
             return False
 
+    async def press(self, selector: str, key: str, timeout: float = 30000) -> bool:
+        """
+        Focus an element and press a key (e.g. "Enter" to submit a search box).
+
+        Args:
+            selector: CSS selector for the element
+            key: Key name as understood by Playwright ("Enter", "Tab", ...)
+            timeout: Maximum wait time in milliseconds
+
+        Returns:
+            True if successful
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        logger.info(f"⌨️  Pressing {key} in: {selector}")
+        try:
+            await self.page.press(selector, key, timeout=timeout)
+            return True
+        except Exception as e:
+            logger.error(f"Press failed: {e}")
+            return False
+
     async def get_text(self, selector: str, timeout: float = 30000) -> Optional[str]:
         """
         Get text content of an element.
@@ -239,6 +304,44 @@ class BrowserAutomation:
         screenshot = await self.page.screenshot(path=path, full_page=full_page)
         return screenshot if not path else None
 
+    async def capture_page(
+        self,
+        url: str,
+        path: str,
+        full_page: bool = True,
+        wait_until: str = "domcontentloaded",
+    ) -> Dict[str, Any]:
+        """
+        Open url in a new tab of the current context, screenshot it, and close the tab.
+
+        The main page is left untouched, so several captures can run concurrently.
+
+        Args:
+            url: URL to capture
+            path: Screenshot save path
+            full_page: Capture full scrollable page
+            wait_until: When to consider navigation complete
+
+        Returns:
+            Response info plus the screenshot path
+        """
+        if not self.context:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        logger.info(f"📸 Capturing {url} -> {path}")
+        page = await self.context.new_page()
+        try:
+            response = await page.goto(url, wait_until=wait_until)
+            await page.screenshot(path=path, full_page=full_page)
+            return {
+                "url": page.url,
+                "title": await page.title(),
+                "status": response.status if response else None,
+                "path": path,
+            }
+        finally:
+            await page.close()
+
     async def get_page_content(self) -> str:
         """Get the HTML content of the current page."""
         if not self.page:
@@ -269,6 +372,46 @@ class BrowserAutomation:
         await self.page.set_input_files(selector, file_path)
         return True
 
+    async def add_init_script(self, script: str) -> None:
+        """
+        Run a script in every document the context loads from now on.
+
+        Registration is idempotent and survives restarts; documents already loaded
+        only pick the script up on their next navigation.
+
+        Args:
+            script: JavaScript source evaluated before any page script
+        """
+        if script in self._init_scripts:
+            return
+        self._init_scripts.append(script)
+        if self.context:
+            await self.context.add_init_script(script=script)
+
+    async def block_resources(self, resource_types: Iterable[str]) -> None:
+        """
+        Abort requests for the given resource types on the current page.
+
+        The route handler is installed once per page; later calls only swap the
+        blocked set. Pass an empty iterable to let everything through again.
+
+        Args:
+            resource_types: Playwright resource types ("image", "font", "stylesheet", ...)
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        self._blocked_resource_types = frozenset(resource_types)
+        if self._routed_page is not self.page:
+            await self.page.route("**/*", self._route_filter)
+            self._routed_page = self.page
+
+    async def _route_filter(self, route) -> None:
+        if route.request.resource_type in self._blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def wait_for_selector(
         self,
         selector: str,
@@ -330,6 +473,8 @@ class BrowserAutomation:
                     result = await self.click(**params)
                 elif action == "fill":
                     result = await self.fill(**params)
+                elif action == "press":
+                    result = await self.press(**params)
                 elif action == "wait":
                     result = await self.wait_for_selector(**params)
                 elif action == "screenshot":
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import logging
 from pathlib import Path
-from typing import Optional, Union
+from typing import AsyncIterator, Optional, Union
 from PIL import Image
 import io
 
@@ -11,6 +11,21 @@ from nerva.config import NervaConfig
 
 logger = logging.getLogger(__name__)
 
+BROWSER_ACTION_PROMPT = """You are a browser automation assistant. Analyze this screenshot and determine the next action.
+
+TASK: {task}
+
+Provide your response in this exact format:
+ACTION: [click|type|scroll|navigate|wait]
+TARGET: [description of element or URL]
+VALUE: [text to type, or N/A]
+REASON: [why this action accomplishes the task]
+CONFIDENCE: [high|medium|low]
+
+If the task is already complete, respond:
+ACTION: complete
+REASON: [what was accomplished]"""
+
 
 class QwenVision:
     """
@@ -61,14 +76,14 @@ class QwenVision:
 
     async def analyze_screenshot(
         self,
-        image_path: Union[str, Path],
+        image_path: Union[str, Path, bytes],
         prompt: str = "Describe what you see in this screenshot in detail.",
     ) -> str:
         """
         Analyze a screenshot and return a description.
 
         Args:
-            image_path: Path to screenshot image
+            image_path: Path to screenshot image (or encoded image bytes)
             prompt: Analysis prompt
 
         Returns:
@@ -82,7 +97,7 @@ class QwenVision:
             {"role": "user", "content": prompt}
         ]
 
-        logger.debug(f"[QwenVision] Analyzing screenshot: {image_path}")
+        logger.debug(f"[QwenVision] Analyzing screenshot: {self._describe(image_path)}")
         response = await self.client.vision_chat(
             messages=messages,
             images=[image_bytes],
@@ -90,6 +105,33 @@ class QwenVision:
 
         return response
 
+    async def analyze_screenshot_stream(
+        self,
+        image_path: Union[str, Path, bytes],
+        prompt: str,
+    ) -> AsyncIterator[str]:
+        """
+        Like analyze_screenshot, but yield the response text as it streams in.
+
+        Args:
+            image_path: Path to screenshot image (or encoded image bytes)
+            prompt: Analysis prompt
+
+        Yields:
+            Response text chunks
+        """
+        image_bytes = self._load_image(image_path)
+        messages = [
+            {"role": "user", "content": prompt}
+        ]
+
+        logger.debug(f"[QwenVision] Streaming analysis of screenshot: {self._describe(image_path)}")
+        async for chunk in self.client.vision_chat_stream(
+            messages=messages,
+            images=[image_bytes],
+        ):
+            yield chunk
+
     async def extract_ui_elements(
         self,
         image_path: Union[str, Path],
@@ -144,35 +186,42 @@ If not found, say "NOT FOUND" and suggest similar elements."""
 
     async def extract_browser_action(
         self,
-        image_path: Union[str, Path],
+        image_path: Union[str, Path, bytes],
         task: str,
     ) -> str:
         """
         Analyze screenshot and determine next browser action for a task.
 
         Args:
-            image_path: Path to browser screenshot
+            image_path: Path to browser screenshot (or encoded image bytes)
             task: Task to accomplish (e.g., "Find the search button")
 
         Returns:
             Recommended action in structured format
         """
-        prompt = f"""You are a browser automation assistant. Analyze this screenshot and determine the next action.
+        prompt = BROWSER_ACTION_PROMPT.format(task=task)
 
-TASK: {task}
+        return await self.analyze_screenshot(image_path, prompt)
 
-Provide your response in this exact format:
-ACTION: [click|type|scroll|navigate|wait]
-TARGET: [description of element or URL]
-VALUE: [text to type, or N/A]
-REASON: [why this action accomplishes the task]
-CONFIDENCE: [high|medium|low]
+    def extract_browser_action_stream(
+        self,
+        image_path: Union[str, Path, bytes],
+        task: str,
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of extract_browser_action.
 
-If the task is already complete, respond:
-ACTION: complete
-REASON: [what was accomplished]"""
+        The ACTION and TARGET lines come first, so callers can start preparing the
+        action before REASON/CONFIDENCE finish generating.
 
-        return await self.analyze_screenshot(image_path, prompt)
+        Args:
+            image_path: Path to browser screenshot (or encoded image bytes)
+            task: Task to accomplish
+
+        Returns:
+            Async iterator of response text chunks
+        """
+        return self.analyze_screenshot_stream(image_path, BROWSER_ACTION_PROMPT.format(task=task))
 
     async def verify_action_result(
         self,
@@ -234,23 +283,35 @@ EVIDENCE: explain why."""
 
         return await self.analyze_screenshot(image_path, prompt)
 
-    def _load_image(self, image_path: Union[str, Path]) -> bytes:
+    @staticmethod
+    def _describe(image_path: Union[str, Path, bytes]) -> str:
+        if isinstance(image_path, bytes):
+            return f"<{len(image_path)} bytes in memory>"
+        return str(image_path)
+
+    def _load_image(self, image_path: Union[str, Path, bytes]) -> bytes:
         """
         Load image file as bytes.
 
         Args:
-            image_path: Path to image file
+            image_path: Path to image file, or already-encoded image bytes
 
         Returns:
             Image as bytes
         """
-        path = Path(image_path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"Image not found: {path}")
-
-        # Load with PIL to ensure format compatibility
-        img = Image.open(path)
+        if isinstance(image_path, bytes):
+            img = Image.open(io.BytesIO(image_path))
+            # In-memory JPEG/PNG screenshots are already RGB; send them without re-encoding
+            if img.mode == "RGB" and img.format in ("JPEG", "PNG"):
+                return image_path
+        else:
+            path = Path(image_path)
+
+            if not path.exists():
+                raise FileNotFoundError(f"Image not found: {path}")
+
+            # Load with PIL to ensure format compatibility
+            img = Image.open(path)
 
         # Convert to RGB if necessary (remove alpha channel)
         if img.mode in ("RGBA", "LA", "P"):
@@ -1,6 +1,7 @@
 # nerva/workflows.py
 from __future__ import annotations
 from typing import Any, Dict, List
+import asyncio
 import json
 from pathlib import Path
 import logging
@@ -86,7 +87,7 @@ def build_screen_dag(llm: BaseLLMClient, memory: MemoryStore) -> Dag:
     dag.add_node(DagNode("llm_analyze", node_llm_analyze, deps=["capture"]))
     dag.add_node(DagNode("memory_write", node_memory_write, deps=["llm_analyze"]))
 
-    return dag
+    return dag.finalize()
 
 
 # ============================================================================
@@ -161,7 +162,7 @@ def build_voice_dag(llm: BaseLLMClient, memory: MemoryStore) -> Dag:
     dag.add_node(DagNode("intent_and_answer", node_intent_and_answer, deps=["input"]))
     dag.add_node(DagNode("memory_write", node_memory_write, deps=["intent_and_answer"]))
 
-    return dag
+    return dag.finalize()
 
 
 # ============================================================================
@@ -251,7 +252,7 @@ def build_daily_ops_dag(llm: BaseLLMClient, memory: MemoryStore) -> Dag:
     dag.add_node(DagNode("llm", node_llm, deps=["collect"]))
     dag.add_node(DagNode("memory", node_memory, deps=["llm"]))
 
-    return dag
+    return dag.finalize()
 
 
 # ============================================================================
@@ -283,13 +284,14 @@ def build_repo_dag(llm: BaseLLMClient, memory: MemoryStore) -> Dag:
         if not ctx.repo_root:
             raise RuntimeError("repo-assistant: repo_root missing")
 
-        root = Path(ctx.repo_root).resolve()
+        # The walk, stats and reads are blocking; keep them off the event loop (TUI stays responsive)
+        root = await asyncio.to_thread(Path(ctx.repo_root).resolve)
         logger.info(f"[Repo] Indexing repository: {root}")
-        files = index_repo(root)
+        files = await asyncio.to_thread(index_repo, root)
 
         # Build structured context (will use HydraContext later)
         structure_summary = summarize_repo_structure(files)
-        hydra_context = build_context_for_repo(root, question=ctx.repo_question)
+        hydra_context = await asyncio.to_thread(build_context_for_repo, root, question=ctx.repo_question)
 
         ctx.repo_context = {
             "root": str(root),
@@ -339,4 +341,4 @@ def build_repo_dag(llm: BaseLLMClient, memory: MemoryStore) -> Dag:
     dag.add_node(DagNode("llm", node_llm, deps=["index"]))
     dag.add_node(DagNode("memory", node_memory, deps=["llm"]))
 
-    return dag
+    return dag.finalize()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for the async DAG executor: ordering, level scheduling and validation.
+
+Usage:
+  python test_dag.py
+  pytest test_dag.py
+"""
+import asyncio
+
+from nerva.dag import Dag, DagNode
+from nerva.run_context import RunContext
+
+
+def _recorder(log, name, delay=0.0, fail=False):
+    async def node(ctx: RunContext) -> None:
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        log.append(("end", name))
+
+    return node
+
+
+def _raises(func, exc_type, text):
+    try:
+        func()
+    except exc_type as exc:
+        assert text in str(exc), str(exc)
+    else:
+        raise AssertionError(f"{exc_type.__name__} not raised")
+
+
+def test_levels_group_nodes_by_dependency_depth():
+    dag = Dag("levels")
+    dag.add_node(DagNode("report", _recorder([], "report"), deps=["summary", "tasks"]))
+    dag.add_node(DagNode("collect", _recorder([], "collect")))
+    dag.add_node(DagNode("summary", _recorder([], "summary"), deps=["collect"]))
+    dag.add_node(DagNode("tasks", _recorder([], "tasks"), deps=["collect"]))
+    dag.finalize()
+    assert [[node.name for node in level] for level in dag._levels] == [
+        ["collect"],
+        ["summary", "tasks"],
+        ["report"],
+    ]
+
+
+def test_independent_nodes_run_concurrently_after_their_deps():
+    log = []
+    dag = Dag("concurrent")
+    dag.add_node(DagNode("c", _recorder(log, "c"), deps=["a", "b"]))
+    dag.add_node(DagNode("a", _recorder(log, "a", delay=0.02)))
+    dag.add_node(DagNode("b", _recorder(log, "b", delay=0.02)))
+    asyncio.run(dag.run(RunContext(mode="test")))
+    # a and b both start before either finishes; c starts only after both end
+    assert log[:2] == [("start", "a"), ("start", "b")]
+    assert log[4:] == [("start", "c"), ("end", "c")]
+
+
+def test_missing_dependency_is_rejected_at_finalize():
+    dag = Dag("missing")
+    dag.add_node(DagNode("x", _recorder([], "x"), deps=["z"]))
+    _raises(dag.finalize, ValueError, "Missing node z")
+
+
+def test_cycle_is_rejected_at_finalize():
+    dag = Dag("cycle")
+    dag.add_node(DagNode("x", _recorder([], "x"), deps=["y"]))
+    dag.add_node(DagNode("y", _recorder([], "y"), deps=["x"]))
+    _raises(dag.finalize, ValueError, "Cycle detected")
+
+
+def test_overlapping_writes_in_one_level_are_rejected():
+    dag = Dag("writes")
+    dag.add_node(DagNode("a", _recorder([], "a"), writes={"intent"}))
+    dag.add_node(DagNode("b", _recorder([], "b"), writes={"intent", "repo_answer"}))
+    _raises(dag.finalize, ValueError, "both write 'intent'")
+
+
+def test_overlapping_writes_in_different_levels_are_allowed():
+    dag = Dag("sequential-writes")
+    dag.add_node(DagNode("a", _recorder([], "a"), writes={"intent"}))
+    dag.add_node(DagNode("b", _recorder([], "b"), deps=["a"], writes={"intent"}))
+    dag.finalize()
+
+
+def test_failure_cancels_siblings_in_the_level():
+    log = []
+    dag = Dag("cancel")
+    dag.add_node(DagNode("fails", _recorder(log, "fails", delay=0.01, fail=True)))
+    dag.add_node(DagNode("slow", _recorder(log, "slow", delay=0.5)))
+    dag.add_node(DagNode("after", _recorder(log, "after"), deps=["fails", "slow"]))
+
+    async def run_and_settle():
+        try:
+            await dag.run(RunContext(mode="test"))
+        finally:
+            # Let the cancelled sibling unwind before checking the log
+            await asyncio.sleep(0.05)
+
+    _raises(lambda: asyncio.run(run_and_settle()), RuntimeError, "fails failed")
+    assert ("end", "slow") not in log
+    assert ("start", "after") not in log
+
+
+def test_add_node_after_finalize_recomputes_order():
+    log = []
+    dag = Dag("refinalize")
+    dag.add_node(DagNode("a", _recorder(log, "a")))
+    dag.finalize()
+    dag.add_node(DagNode("b", _recorder(log, "b"), deps=["a"]))
+    asyncio.run(dag.run(RunContext(mode="test")))
+    assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✓ {name}")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for DesktopAutomation.type_text's clipboard paste path (pyautogui/pyperclip mocked).
+
+Usage:
+  python test_desktop_automation.py
+  pytest test_desktop_automation.py
+"""
+from unittest import mock
+
+import nerva.desktop.automation as automation
+
+
+class _FakeClipboard:
+    def __init__(self, content="user clipboard", fail_copy=False):
+        self.content = content
+        self.fail_copy = fail_copy
+        self.copies = []
+
+    def paste(self):
+        return self.content
+
+    def copy(self, text):
+        self.copies.append(text)
+        if self.fail_copy and len(self.copies) == 1:
+            raise RuntimeError("no clipboard")
+        self.content = text
+
+
+def _type(text, clipboard, **kwargs):
+    """Run type_text with mocked backends; return the pyautogui mock."""
+    gui = mock.Mock()
+    with mock.patch.multiple(
+        automation,
+        pyautogui=gui,
+        PYAUTOGUI_AVAILABLE=True,
+        pyperclip=clipboard,
+        PYPERCLIP_AVAILABLE=True,
+        PASTE_SETTLE_SECONDS=0,
+    ):
+        automation.DesktopAutomation().type_text(text, **kwargs)
+    return gui
+
+
+def test_short_text_is_typed():
+    clipboard = _FakeClipboard()
+    gui = _type("x" * automation.PASTE_THRESHOLD, clipboard)
+    gui.typewrite.assert_called_once()
+    gui.hotkey.assert_not_called()
+    assert clipboard.copies == []
+
+
+def test_long_text_is_pasted_and_clipboard_restored():
+    clipboard = _FakeClipboard()
+    text = "y" * (automation.PASTE_THRESHOLD + 1)
+    gui = _type(text, clipboard)
+    gui.hotkey.assert_called_once_with(*automation._PASTE_KEYS)
+    gui.typewrite.assert_not_called()
+    assert clipboard.copies == [text, "user clipboard"]
+    assert clipboard.content == "user clipboard"
+
+
+def test_use_paste_false_types_long_text():
+    clipboard = _FakeClipboard()
+    gui = _type("z" * 100, clipboard, use_paste=False)
+    gui.typewrite.assert_called_once()
+    assert clipboard.copies == []
+
+
+def test_failed_paste_falls_back_to_typing_and_restores():
+    clipboard = _FakeClipboard(fail_copy=True)
+    text = "w" * 100
+    gui = _type(text, clipboard)
+    gui.hotkey.assert_not_called()
+    gui.typewrite.assert_called_once_with(text, interval=0.05)
+    assert clipboard.content == "user clipboard"
+
+
+def test_missing_pyperclip_types_long_text():
+    gui = mock.Mock()
+    with mock.patch.multiple(automation, pyautogui=gui, PYAUTOGUI_AVAILABLE=True, PYPERCLIP_AVAILABLE=False):
+        automation.DesktopAutomation().type_text("v" * 100)
+    gui.typewrite.assert_called_once()
+    gui.hotkey.assert_not_called()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✓ {name}")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the declarative playbook structures and the runner's step references.
+
+Usage:
+  python test_playbooks.py
+  pytest test_playbooks.py
+"""
+import asyncio
+
+from nerva.automation.playbooks import Playbook, PlaybookRunner, PlaybookStep, instantiate_steps
+from nerva.automation.playbooks_google import build_gmail_inbox_playbook
+
+
+def test_step_params_are_read_only():
+    step = PlaybookStep("a", "click", {"selector": "x"})
+    try:
+        step.params["selector"] = "y"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("PlaybookStep.params accepted an assignment")
+    assert step.params["selector"] == "x"
+
+
+def test_step_params_copy_the_caller_dict():
+    params = {"selector": "x"}
+    step = PlaybookStep("a", "click", params)
+    params["selector"] = "y"
+    assert step.params["selector"] == "x"
+
+
+def test_cached_playbook_steps_are_read_only():
+    playbook = build_gmail_inbox_playbook()
+    for step in playbook.steps:
+        try:
+            step.params["injected"] = True
+        except TypeError:
+            continue
+        raise AssertionError(f"Step {step.display_name} has mutable params")
+    assert all("injected" not in step.params for step in build_gmail_inbox_playbook().steps)
+
+
+def test_instantiated_steps_are_read_only():
+    template = (PlaybookStep("fill", "fill", {"selector": "q", "text": "<QUERY>"}),)
+    (step,) = instantiate_steps(template, "<QUERY>", "hello")
+    assert step.params["text"] == "hello"
+    assert template[0].params["text"] == "<QUERY>"
+    try:
+        step.params["text"] = "other"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Instantiated step params accepted an assignment")
+
+
+def test_display_name_formats_tuple_names():
+    assert PlaybookStep(("capture_result", 2), "get_text").display_name == "capture_result_2"
+    assert PlaybookStep("open", "navigate").display_name == "open"
+
+
+class _FakeBrowser:
+    """Records calls; stands in for BrowserAutomation so the runner needs no real browser."""
+
+    page = True
+
+    def __init__(self):
+        self.calls = []
+
+    async def add_init_script(self, script):
+        self.calls.append(("add_init_script", script))
+
+    async def wait_for_selector(self, selector, timeout=None):
+        return True
+
+    async def get_links(self, selector):
+        self.calls.append(("get_links", selector))
+        return ["https://a.example", "https://b.example"]
+
+    async def navigate(self, url):
+        self.calls.append(("navigate", url))
+        return {"url": url}
+
+
+def _run(playbook, browser):
+    return asyncio.run(PlaybookRunner(browser=browser).run(playbook))
+
+
+def test_step_reference_with_index_uses_earlier_result():
+    browser = _FakeBrowser()
+    playbook = Playbook(
+        "refs",
+        (
+            PlaybookStep("links", "get_links", {"selector": "a"}),
+            PlaybookStep("open", "navigate", {"url": "{{steps.links[1]}}"}),
+        ),
+    )
+    results = _run(playbook, browser)
+    assert [r["status"] for r in results] == ["ok", "ok"]
+    assert ("navigate", "https://b.example") in browser.calls
+    # The shared step params keep the unresolved reference
+    assert playbook.steps[1].params["url"] == "{{steps.links[1]}}"
+
+
+def test_step_reference_without_index_passes_whole_result():
+    browser = _FakeBrowser()
+    playbook = Playbook(
+        "whole",
+        (
+            PlaybookStep("first", "navigate", {"url": "https://a.example"}),
+            PlaybookStep("second", "navigate", {"url": "{{steps.first}}"}),
+        ),
+    )
+    _run(playbook, browser)
+    assert browser.calls[-1] == ("navigate", {"url": "https://a.example"})
+
+
+def test_step_reference_to_tuple_name_uses_display_name():
+    browser = _FakeBrowser()
+    playbook = Playbook(
+        "tuple-name",
+        (
+            PlaybookStep(("links", 0), "get_links", {"selector": "a"}),
+            PlaybookStep("open", "navigate", {"url": "{{steps.links_0[0]}}"}),
+        ),
+    )
+    _run(playbook, browser)
+    assert browser.calls[-1] == ("navigate", "https://a.example")
+
+
+def test_bad_step_references_fail_the_step():
+    browser = _FakeBrowser()
+    playbook = Playbook(
+        "bad-refs",
+        (
+            PlaybookStep("links", "get_links", {"selector": "a"}),
+            PlaybookStep("missing", "navigate", {"url": "{{steps.nope}}"}),
+            PlaybookStep("out_of_range", "navigate", {"url": "{{steps.links[5]}}"}),
+        ),
+    )
+    results = _run(playbook, browser)
+    assert [r["status"] for r in results] == ["ok", "error", "error"]
+    assert "No result from step 'nope'" in results[1]["error"]
+    assert "has no item 5" in results[2]["error"]
+    assert not any(call[0] == "navigate" for call in browser.calls)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✓ {name}")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the task dispatcher's safety checks.
+
+Usage:
+  python test_task_dispatcher.py
+  pytest test_task_dispatcher.py
+"""
+from nerva.agents.task_dispatcher import SafetyManager, TaskDispatcher
+
+
+def test_risky_keywords_require_confirmation():
+    safety = SafetyManager()
+    for keyword in SafetyManager.risky_keywords:
+        assert safety.requires_confirmation(f"please {keyword} it"), keyword
+
+
+def test_inflected_risky_words_require_confirmation():
+    safety = SafetyManager()
+    for command in (
+        "Deleting the old drafts",
+        "removes the label from every thread",
+        "Sending the report to Sam",
+        "sends it now",
+        "the form should be submitted",
+        "Published the post",
+        "purchasing two tickets",
+        "Transferred $50 to savings",
+    ):
+        assert safety.requires_confirmation(command), command
+
+
+def test_prefixed_risky_words_require_confirmation():
+    safety = SafetyManager()
+    for command in (
+        "resend the invoice",
+        "resubmit the form",
+        "undelete x",
+        "unpublish page",
+    ):
+        assert safety.requires_confirmation(command), command
+
+
+def test_safe_commands_do_not_require_confirmation():
+    safety = SafetyManager()
+    for command in (
+        "summarize my inbox",
+        "what's on my calendar today",
+        "open the weekly report",
+        "read my latest messages",
+    ):
+        assert not safety.requires_confirmation(command), command
+
+
+def test_only_create_paths_skip_command_clarification():
+    # _clarifies_itself only consults the keyword helpers, so no skills/LLM are needed
+    dispatcher = TaskDispatcher.__new__(TaskDispatcher)
+    assert dispatcher._clarifies_itself("calendar", "Schedule a meeting with Sam tomorrow")
+    assert dispatcher._clarifies_itself("gmail", "Send an email to sam@example.com")
+    assert not dispatcher._clarifies_itself("calendar", "What's on my calendar?")
+    assert not dispatcher._clarifies_itself("gmail", "Summarize my inbox")
+    assert not dispatcher._clarifies_itself("vision", "Schedule a meeting")
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✓ {name}")
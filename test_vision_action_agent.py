@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for VisionActionAgent's near-duplicate vision response cache.
+
+Usage:
+  python test_vision_action_agent.py
+  pytest test_vision_action_agent.py
+"""
+import asyncio
+from collections import OrderedDict
+from pathlib import Path
+
+import nerva.agents.vision_action_agent as agent_module
+from nerva.agents.vision_action_agent import BrowserAction, VisionActionAgent
+
+
+class _FakeVision:
+    def __init__(self):
+        self.calls = 0
+
+    async def extract_browser_action(self, screenshot, task):
+        self.calls += 1
+        return f"ACTION: click\nTARGET: button {self.calls}"
+
+
+class _FakeBrowser:
+    page = object()
+
+
+def _agent(vision):
+    # Bypass __init__ so no real browser, vision model or planner is created
+    agent = VisionActionAgent.__new__(VisionActionAgent)
+    agent.vision = vision
+    agent.browser = _FakeBrowser()
+    agent._vision_cache = OrderedDict()
+    agent._frame_hash = None
+
+    async def handler(page, action):
+        return None
+
+    agent._action_handlers = {name: handler for name in ("click", "type", "navigate", "scroll", "wait")}
+    return agent
+
+
+def _run_frames(steps):
+    """Send near-identical frames, executing the given action between them; return vision calls."""
+    vision = _FakeVision()
+    agent = _agent(vision)
+    original = agent_module._dhash
+    # Every frame differs from the first by one bit: well inside the near-duplicate distance
+    hashes = iter([0b1010, 0b1011, 0b1010, 0b1011])
+    agent_module._dhash = lambda source: next(hashes)
+
+    async def scenario():
+        await agent._vision_action(Path("frame.jpg"), "task", b"frame")
+        for action_type in steps:
+            if action_type is not None:
+                await agent._perform_action(BrowserAction(action_type=action_type, target="x"))
+            await agent._vision_action(Path("frame.jpg"), "task", b"frame")
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        agent_module._dhash = original
+    return vision.calls
+
+
+def test_near_duplicate_frame_reuses_response():
+    assert _run_frames([None]) == 1
+
+
+def test_click_then_near_identical_frame_calls_vision_again():
+    assert _run_frames(["click"]) == 2
+
+
+def test_mutating_actions_clear_the_cache():
+    assert _run_frames(["type", "navigate"]) == 3
+
+
+def test_wait_and_scroll_keep_the_cache():
+    assert _run_frames(["wait", "scroll"]) == 1
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✓ {name}")